@@ -1,7 +1,8 @@
 # fnOS adapter for integrating with fnOS system
 from .api_client import APIClient
+from .api_client_async import AsyncAPIClient
 from .auth import Auth
 from .hardware import get_hardware_info
 from . import log_parser
 
-__all__ = ["APIClient", "Auth", "get_hardware_info", "log_parser"]
+__all__ = ["APIClient", "AsyncAPIClient", "Auth", "get_hardware_info", "log_parser"]
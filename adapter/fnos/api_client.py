@@ -1,33 +1,120 @@
-import importlib
-from typing import Any, Dict, Optional
-from urllib.parse import urljoin
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from core.config.config_manager import get_value
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+_DEFAULT_BASE_URL = get_value("FNOS_BASE_URL", "http://localhost:8000")
+_DEFAULT_TOKEN = get_value("FNOS_SUPER_TOKEN", "")
+
+# Process-wide session so TCP/TLS connections to fnOS are reused across clients
+_SHARED_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        with _SESSION_LOCK:
+            if _SHARED_SESSION is None:
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=64,
+                    max_retries=Retry(
+                        total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]
+                    ),
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SHARED_SESSION = session
+    return _SHARED_SESSION
+
+
+def _token_key(token: Optional[str]) -> str:
+    # Cache keys hold a digest of the bearer token, never the raw value
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest() if token else ""
+
+
+# Conditional GET cache: (token digest, url, params) -> (etag, payload)
+# Payloads stored here are private; callers always get a deep copy
+_ETAG_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[str, Any]]" = OrderedDict()
+_ETAG_CACHE_LOCK = threading.Lock()
+_ETAG_CACHE_MAX = 256
+
+
+def _etag_get(key: Tuple[str, str, str]) -> Optional[Tuple[str, Any]]:
+    with _ETAG_CACHE_LOCK:
+        entry = _ETAG_CACHE.get(key)
+        if entry is not None:
+            _ETAG_CACHE.move_to_end(key)
+        return entry
+
+
+def _etag_put(key: Tuple[str, str, str], etag: str, payload: Any) -> None:
+    with _ETAG_CACHE_LOCK:
+        _ETAG_CACHE[key] = (etag, payload)
+        _ETAG_CACHE.move_to_end(key)
+        while len(_ETAG_CACHE) > _ETAG_CACHE_MAX:
+            _ETAG_CACHE.popitem(last=False)
+
+
 class APIClient:
     def __init__(self, base_url: Optional[str] = None, token: Optional[str] = None):
-        self.base_url = base_url or get_value("FNOS_BASE_URL", "http://localhost:8000")
-        self.token = token or get_value("FNOS_SUPER_TOKEN", "")
-        self._requests = importlib.import_module("requests")
-        self.session = self._requests.Session()
-        if self.token:
-            self.session.headers.update({"Authorization": f"Bearer {self.token}"})
+        self.base_url = base_url or _DEFAULT_BASE_URL
+        self._base_url = self.base_url.rstrip("/")
+        self.token = token or _DEFAULT_TOKEN
+        self.session = _get_session()
+        # Auth headers are passed per request; the shared session is never mutated
+        self.headers = {"Authorization": f"Bearer {self.token}"} if self.token else None
+        self._token_key = _token_key(self.token)
+
+    def _url(self, path: str) -> str:
+        if not path.startswith("/"):
+            path = "/" + path
+        return self._base_url + path
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         try:
-            url = urljoin(self.base_url, path)
-            r = self.session.get(url, params=params, timeout=5)
+            url = self._url(path)
+            key = (self._token_key, url, repr(sorted(params.items())) if params else "")
+            cached = _etag_get(key)
+            headers = self.headers
+            if cached is not None:
+                headers = dict(self.headers or {})
+                headers["If-None-Match"] = cached[0]
+            r = self.session.get(url, params=params, headers=headers, timeout=5)
+            if r.status_code == 304 and cached is not None:
+                # Callers may mutate what they get back; keep the cached copy intact
+                return copy.deepcopy(cached[1])
             if r.status_code >= 200 and r.status_code < 300:
-                return r.json()
+                payload = _loads(r.content)
+                etag = r.headers.get("ETag")
+                if etag:
+                    _etag_put(key, etag, copy.deepcopy(payload))
+                return payload
             return None
         except Exception:
             return None
 
     def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         try:
-            url = urljoin(self.base_url, path)
-            r = self.session.post(url, json=json, timeout=5)
+            url = self._url(path)
+            r = self.session.post(url, json=json, headers=self.headers, timeout=5)
             if r.status_code >= 200 and r.status_code < 300:
-                return r.json()
+                return _loads(r.content)
             return None
         except Exception:
             return None
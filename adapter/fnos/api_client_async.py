@@ -0,0 +1,68 @@
+import functools
+import importlib
+from typing import Any, Dict, Optional
+from .api_client import _DEFAULT_BASE_URL, _DEFAULT_TOKEN, _loads
+
+
+@functools.cache
+def _httpx():
+    return importlib.import_module("httpx")
+
+
+def _new_client():
+    httpx = _httpx()
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        timeout=5.0,
+    )
+
+
+class AsyncAPIClient:
+    """
+    Async fnOS API client.
+
+    httpx clients are bound to the event loop they were created on, and Flask
+    runs each async view on its own loop, so connections are not kept across
+    requests. Use ``async with AsyncAPIClient() as client`` to share one
+    connection pool between several calls; outside of it every call opens and
+    closes its own client.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, token: Optional[str] = None):
+        self.base_url = base_url or _DEFAULT_BASE_URL
+        self._base_url = self.base_url.rstrip("/")
+        self.token = token or _DEFAULT_TOKEN
+        self.headers = {"Authorization": f"Bearer {self.token}"} if self.token else None
+        self._client = None
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        self._client = _new_client()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        client, self._client = self._client, None
+        await client.aclose()
+
+    def _url(self, path: str) -> str:
+        if not path.startswith("/"):
+            path = "/" + path
+        return self._base_url + path
+
+    async def _request(self, method: str, path: str, **kwargs) -> Optional[Dict[str, Any]]:
+        try:
+            if self._client is not None:
+                r = await self._client.request(method, self._url(path), headers=self.headers, **kwargs)
+            else:
+                async with _new_client() as client:
+                    r = await client.request(method, self._url(path), headers=self.headers, **kwargs)
+            if r.status_code >= 200 and r.status_code < 300:
+                return _loads(r.content)
+            return None
+        except Exception:
+            return None
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        return await self._request("GET", path, params=params)
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        return await self._request("POST", path, json=json)
@@ -1,11 +1,77 @@
-from typing import Optional
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from core.config.config_manager import get_value
-from .api_client import APIClient
+from .api_client import APIClient, _DEFAULT_BASE_URL
+from .api_client_async import AsyncAPIClient
+
+_CHECK_PATH = get_value("FNOS_AUTH_CHECK_PATH", "/api/v1/admin/me")
+_ADMIN_ROLES = frozenset(("admin", "superadmin", "super_admin"))
+
+# Session validation cache: token hash -> (expiry, is_admin)
+_SESSION_CACHE: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+_SESSION_CACHE_LOCK = threading.Lock()
+_SESSION_CACHE_MAX = 1024
+_NEGATIVE_TTL = 5.0
+
+
+def _session_cache_ttl() -> float:
+    try:
+        return float(get_value("FNOS_AUTH_CACHE_TTL", 30))
+    except (TypeError, ValueError):
+        return 30.0
+
+
+def _hash_token(token: str) -> str:
+    # Only keep a digest of the token in memory, never the raw value
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[bool]:
+    with _SESSION_CACHE_LOCK:
+        entry = _SESSION_CACHE.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if expiry <= time.monotonic():
+            del _SESSION_CACHE[key]
+            return None
+        _SESSION_CACHE.move_to_end(key)
+        return value
+
+
+def _cache_put(key: str, value: bool) -> None:
+    ttl = _session_cache_ttl() if value else _NEGATIVE_TTL
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    with _SESSION_CACHE_LOCK:
+        # Purge expired entries opportunistically on insert
+        for k in [k for k, (exp, _) in _SESSION_CACHE.items() if exp <= now]:
+            del _SESSION_CACHE[k]
+        _SESSION_CACHE[key] = (now + ttl, value)
+        _SESSION_CACHE.move_to_end(key)
+        while len(_SESSION_CACHE) > _SESSION_CACHE_MAX:
+            _SESSION_CACHE.popitem(last=False)
+
+
+def _is_admin_response(data: Optional[Dict[str, Any]]) -> bool:
+    if not data:
+        return False
+
+    role = data.get("role") or data.get("is_admin")
+    if isinstance(role, bool):
+        return role
+
+    return isinstance(role, str) and role.lower() in _ADMIN_ROLES
+
 
 class Auth:
     def __init__(self, client: Optional[APIClient] = None):
         self.client = client or APIClient()
-        self.check_path = get_value("FNOS_AUTH_CHECK_PATH", "/api/v1/admin/me")
+        self.check_path = _CHECK_PATH
 
     def is_super_admin(self) -> bool:
         """
@@ -14,13 +80,7 @@ class Auth:
         This uses the internal FNOS_SUPER_TOKEN from environment to check
         if fnOS_Overseer is authorized to call fnOS APIs.
         """
-        data = self.client.get(self.check_path)
-        if not data:
-            return False
-        role = data.get("role") or data.get("is_admin")
-        if isinstance(role, bool):
-            return role
-        return str(role).lower() in ("admin", "superadmin", "super_admin")
+        return _is_admin_response(self.client.get(self.check_path))
 
     def is_super_admin_with_session(self, session_token: Optional[str]) -> bool:
         """
@@ -28,6 +88,8 @@ class Auth:
 
         This validates the CLIENT's session token against fnOS's official API,
         not the internal FNOS_SUPER_TOKEN used by fnOS_Overseer itself.
+        Results are cached per token for FNOS_AUTH_CACHE_TTL seconds (30 by
+        default); rejections are cached for 5 seconds.
 
         Args:
             session_token: The client's session identifier from Cookie or Authorization header
@@ -38,19 +100,34 @@ class Auth:
         if not session_token:
             return False
 
+        key = _hash_token(session_token)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
         # Create a temporary client using the client's session token
         # instead of the internal FNOS_SUPER_TOKEN
         temp_client = APIClient(
-            base_url=get_value("FNOS_BASE_URL", "http://localhost:8000"),
+            base_url=_DEFAULT_BASE_URL,
             token=session_token  # Use client's token
         )
+        result = _is_admin_response(temp_client.get(self.check_path))
+        _cache_put(key, result)
+        return result
 
-        data = temp_client.get(self.check_path)
-        if not data:
+    async def is_super_admin_with_session_async(self, session_token: Optional[str]) -> bool:
+        """
+        Async variant of is_super_admin_with_session, sharing the same cache.
+        """
+        if not session_token:
             return False
 
-        role = data.get("role") or data.get("is_admin")
-        if isinstance(role, bool):
-            return role
+        key = _hash_token(session_token)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
 
-        return str(role).lower() in ("admin", "superadmin", "super_admin")
+        temp_client = AsyncAPIClient(base_url=_DEFAULT_BASE_URL, token=session_token)
+        result = _is_admin_response(await temp_client.get(self.check_path))
+        _cache_put(key, result)
+        return result
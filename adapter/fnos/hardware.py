@@ -1,42 +1,117 @@
-from typing import Dict, Any, Optional
+import functools
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from core.config.config_manager import get_value
 from .api_client import APIClient
-import psutil
+
+_HW_PATH = get_value("FNOS_HW_PATH", "/api/v1/hardware")
+
+_PARTITIONS_TTL = 60
+_GIB = 1.0 / (1024**3)
+
+
+@functools.lru_cache(maxsize=1)
+def _psutil():
+    # psutil is imported on first use to keep adapter import cheap, then reused
+    return importlib.import_module("psutil")
+
+
+@functools.lru_cache(maxsize=1)
+def _core_counts():
+    # Core counts never change at runtime
+    psutil = _psutil()
+    return psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_partitions(_bucket: int):
+    return _psutil().disk_partitions()
+
+
+def _disk_partitions():
+    """Mounted partitions, refreshed at most every _PARTITIONS_TTL seconds."""
+    return _cached_partitions(int(time.monotonic() // _PARTITIONS_TTL))
+
+
+def _safe_disk_usage(mountpoint: str):
+    try:
+        return _psutil().disk_usage(mountpoint)
+    except Exception:
+        return None
+
 
 class HardwareReader:
     def __init__(self, client: Optional[APIClient] = None):
         self.client = client or APIClient()
-        self.hw_path = get_value("FNOS_HW_PATH", "/api/v1/hardware")
+        self.hw_path = _HW_PATH
+
+    def get_storage_columns(self) -> Dict[str, List[Any]]:
+        """
+        Storage usage as parallel columns (one list per field).
+
+        Cheaper to build and to reduce over than a list of per-device dicts.
+        """
+        parts = _disk_partitions()
+        # statvfs blocks (especially on network mounts), so query mounts in parallel
+        with ThreadPoolExecutor(max_workers=min(8, len(parts) or 1)) as ex:
+            usages = list(ex.map(lambda p: (p, _safe_disk_usage(p.mountpoint)), parts))
+        columns: Dict[str, List[Any]] = {
+            "devices": [],
+            "mountpoints": [],
+            "fstypes": [],
+            "totals_gb": [],
+            "used_gb": [],
+            "percents": [],
+        }
+        for p, u in usages:
+            if u is None:
+                continue
+            columns["devices"].append(p.device)
+            columns["mountpoints"].append(p.mountpoint)
+            columns["fstypes"].append(p.fstype)
+            columns["totals_gb"].append(round(u.total * _GIB, 2))
+            columns["used_gb"].append(round(u.used * _GIB, 2))
+            columns["percents"].append(u.percent)
+        return columns
 
     def get_hardware_info(self) -> Dict[str, Any]:
         data = self.client.get(self.hw_path) or {}
         if not data:
             data = {}
+        psutil = _psutil()
+        physical_cores, logical_cores = _core_counts()
         cpu = {
             "model": psutil.cpu_freq().current if psutil.cpu_freq() else 0,
-            "physical_cores": psutil.cpu_count(logical=False),
-            "logical_cores": psutil.cpu_count(logical=True),
+            "physical_cores": physical_cores,
+            "logical_cores": logical_cores,
         }
         mem = psutil.virtual_memory()
         memory = {
-            "total_gb": round(mem.total / (1024**3), 2),
-            "used_gb": round(mem.used / (1024**3), 2),
+            "total_gb": round(mem.total * _GIB, 2),
+            "used_gb": round(mem.used * _GIB, 2),
             "percent": mem.percent,
         }
-        storage = []
-        for p in psutil.disk_partitions():
-            try:
-                u = psutil.disk_usage(p.mountpoint)
-                storage.append({
-                    "device": p.device,
-                    "mountpoint": p.mountpoint,
-                    "fstype": p.fstype,
-                    "total_gb": round(u.total / (1024**3), 2),
-                    "used_gb": round(u.used / (1024**3), 2),
-                    "percent": u.percent,
-                })
-            except Exception:
-                continue
+        columns = self.get_storage_columns()
+        storage = [
+            {
+                "device": device,
+                "mountpoint": mountpoint,
+                "fstype": fstype,
+                "total_gb": total_gb,
+                "used_gb": used_gb,
+                "percent": percent,
+            }
+            for device, mountpoint, fstype, total_gb, used_gb, percent in zip(
+                columns["devices"],
+                columns["mountpoints"],
+                columns["fstypes"],
+                columns["totals_gb"],
+                columns["used_gb"],
+                columns["percents"],
+            )
+        ]
         base = {"cpu": cpu, "memory": memory, "storage": storage}
         if isinstance(data, dict):
             base.update(data)
@@ -1,24 +1,51 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import List, Dict, Any
-from urllib.parse import urlencode
 from .api_client import APIClient
+from .api_client_async import AsyncAPIClient
 
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fnos-log")
 
-def parse_login_events(d: date) -> List[Dict[str, Any]]:
-    client = APIClient()
-    q = f"/api/v1/logs?{urlencode({'date': d.isoformat(), 'type': 'login'})}"
-    data = client.get(q) or {}
+
+def _logs_path(d: date, log_type: str) -> str:
+    # ISO dates and the fixed log types are URL-safe, no encoding needed
+    return f"/api/v1/logs?date={d.isoformat()}&type={log_type}"
+
+
+def _items(data: Any) -> List[Dict[str, Any]]:
     items = data.get("items") if isinstance(data, dict) else None
     if not items or not isinstance(items, list):
         return []
     return items
 
 
+def _fetch(client: APIClient, d: date, log_type: str) -> List[Dict[str, Any]]:
+    return _items(client.get(_logs_path(d, log_type)))
+
+
+def parse_login_events(d: date) -> List[Dict[str, Any]]:
+    return _fetch(APIClient(), d, "login")
+
+
 def parse_user_actions(d: date) -> List[Dict[str, Any]]:
+    return _fetch(APIClient(), d, "action")
+
+
+def parse_all(d: date) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch login events and user actions concurrently."""
     client = APIClient()
-    q = f"/api/v1/logs?{urlencode({'date': d.isoformat(), 'type': 'action'})}"
-    data = client.get(q) or {}
-    items = data.get("items") if isinstance(data, dict) else None
-    if not items or not isinstance(items, list):
-        return []
-    return items
+    login = _EXECUTOR.submit(_fetch, client, d, "login")
+    action = _EXECUTOR.submit(_fetch, client, d, "action")
+    return {"login_events": login.result(), "user_actions": action.result()}
+
+
+async def parse_all_async(d: date) -> Dict[str, List[Dict[str, Any]]]:
+    """Async variant of parse_all for coroutine callers."""
+    # One client for both requests, closed before returning
+    async with AsyncAPIClient() as client:
+        login, action = await asyncio.gather(
+            client.get(_logs_path(d, "login")),
+            client.get(_logs_path(d, "action")),
+        )
+    return {"login_events": _items(login), "user_actions": _items(action)}
@@ -0,0 +1,24 @@
+import logging
+import threading
+from datetime import date
+
+from .hardware import HardwareReader
+from . import log_parser
+
+logger = logging.getLogger(__name__)
+
+
+def warmup() -> None:
+    """Prime the connection pool and response caches before the first request."""
+    try:
+        HardwareReader().get_hardware_info()
+        log_parser.parse_all(date.today())
+    except Exception as e:
+        logger.debug(f"Cache warmup failed: {e}")
+
+
+def start_warmup() -> threading.Thread:
+    """Run warmup() in a daemon thread so startup is not blocked."""
+    t = threading.Thread(target=warmup, name="fnos-warmup", daemon=True)
+    t.start()
+    return t
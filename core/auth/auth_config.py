@@ -21,21 +21,32 @@ class AuthConfig:
     _instance = None
 
     def __new__(cls):
+        # All initialization happens once here; repeat AuthConfig() calls
+        # just return the existing instance
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._load()
+            cls._instance = instance
         return cls._instance
 
     def __init__(self):
-        # Prevent re-initialization
-        if hasattr(self, '_initialized'):
-            return
+        pass
 
+    def _load(self):
         # Read configuration from environment at startup only
         self._require_auth = self._parse_bool_env("FNOS_REQUIRE_AUTH", "true")
         self._is_production = os.getenv("APP_ENV", "production").lower() not in ("dev", "development")
         self._fnos_base_url = os.getenv("FNOS_BASE_URL", "")
         self._auth_check_path = os.getenv("FNOS_AUTH_CHECK_PATH", "/api/v1/admin/me")
 
+        # All inputs are runtime locked, so the summary never changes
+        self._security_summary = {
+            "requires_auth": self._require_auth,
+            "is_production": self._is_production,
+            "fnos_base_url": self._fnos_base_url,
+            "auth_check_path": self._auth_check_path,
+        }
+
         # Log configuration for audit
         if not self._require_auth:
             logger.warning("SECURITY: Authentication is DISABLED via FNOS_REQUIRE_AUTH")
@@ -44,8 +55,6 @@ class AuthConfig:
         else:
             logger.info("SECURITY: Running in PRODUCTION mode with authentication enabled")
 
-        self._initialized = True
-
     @staticmethod
     def _parse_bool_env(key: str, default: str) -> bool:
         """Parse boolean environment variable."""
@@ -76,12 +85,7 @@ class AuthConfig:
     @property
     def security_summary(self) -> dict:
         """Return security configuration summary (for debugging)."""
-        return {
-            "requires_auth": self._requires_auth,
-            "is_production": self._is_production,
-            "fnos_base_url": self._fnos_base_url,
-            "auth_check_path": self._auth_check_path,
-        }
+        return dict(self._security_summary)
 
 
 # Global singleton instance, initialized at module import
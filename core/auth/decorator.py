@@ -7,20 +7,44 @@ authentication mechanisms:
 - require_api_token: Requires API token (for webhooks, etc.)
 """
 
+import hmac
+import inspect
 import os
+import threading
 from functools import wraps
 import logging
-from typing import Optional
-import importlib
+from typing import Optional, TYPE_CHECKING
 
 from flask import request, jsonify
 
 from .auth_config import auth_config
-from adapter.fnos.auth import Auth
 from web.backend.models.data_models import err
 
+if TYPE_CHECKING:
+    from adapter.fnos.auth import Auth
+
 logger = logging.getLogger(__name__)
 
+# Webhook token, read once; kept as bytes for the constant-time compare
+_EXPECTED_TOKEN = os.getenv("WEBHOOK_TOKEN", "").encode()
+
+# Shared Auth instance, created lazily on first protected request
+_AUTH: Optional["Auth"] = None
+_auth_lock = threading.Lock()
+
+
+def _get_auth() -> "Auth":
+    """Get or create the process-wide Auth instance."""
+    global _AUTH
+    if _AUTH is None:
+        with _auth_lock:
+            if _AUTH is None:
+                # Imported here so the adapter stack loads on first protected request
+                from adapter.fnos.auth import Auth
+
+                _AUTH = Auth()
+    return _AUTH
+
 
 def require_super_admin(f):
     """
@@ -55,7 +79,7 @@ def require_super_admin(f):
 
         # Layer 3: Validate with fnOS official API
         # Use client's session token, not internal FNOS_SUPER_TOKEN
-        auth = Auth()
+        auth = _get_auth()
         is_admin = auth.is_super_admin_with_session(session_token)
 
         if not is_admin:
@@ -69,6 +93,34 @@ def require_super_admin(f):
         logger.debug(f"Auth passed for {request.path}")
         return f(*args, **kwargs)
 
+    @wraps(f)
+    async def async_wrapper(*args, **kwargs):
+        # Same layers as wrapper, but the fnOS check does not block the worker
+        if not auth_config.requires_auth:
+            logger.debug(f"Auth disabled, allowing request to {request.path}")
+            return await f(*args, **kwargs)
+
+        session_token = _extract_session_token()
+
+        if not session_token:
+            logger.warning(f"Auth failed: No session token provided for {request.path}")
+            return jsonify(err(403, "No authentication provided")), 403
+
+        auth = _get_auth()
+        is_admin = await auth.is_super_admin_with_session_async(session_token)
+
+        if not is_admin:
+            logger.warning(
+                f"Auth failed: User is not super admin for {request.path} "
+                f"(from {request.remote_addr})"
+            )
+            return jsonify(err(403, "Forbidden: Super admin required")), 403
+
+        logger.debug(f"Auth passed for {request.path}")
+        return await f(*args, **kwargs)
+
+    if inspect.iscoroutinefunction(f):
+        return async_wrapper
     return wrapper
 
 
@@ -92,11 +144,8 @@ def require_api_token(f):
 
     @wraps(f)
     def wrapper(*args, **kwargs):
-        # Get expected token from environment
-        expected_token = os.getenv("WEBHOOK_TOKEN", "")
-
         # If no token is configured, skip validation (dev mode)
-        if not expected_token:
+        if not _EXPECTED_TOKEN:
             logger.warning(
                 f"WEBHOOK_TOKEN not configured, skipping validation for {request.path}"
             )
@@ -109,8 +158,8 @@ def require_api_token(f):
             logger.warning(f"Auth failed: No API token provided for {request.path}")
             return jsonify(err(401, "Unauthorized: API token required")), 401
 
-        # Validate token
-        if provided_token != expected_token:
+        # Validate token in constant time
+        if not hmac.compare_digest(provided_token.encode(), _EXPECTED_TOKEN):
             logger.warning(
                 f"Auth failed: Invalid API token for {request.path} from {request.remote_addr}"
             )
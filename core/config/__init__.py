@@ -1,13 +1,13 @@
 # Configuration management
-from .config_manager import ConfigManager, get_config, get_value, _GLOBAL as _global_manager
+from .config_manager import ConfigManager, get_config, get_manager, get_value
 
 # Create a config_manager namespace for accessing the global instance
 class _ConfigManagerNamespace:
     @property
     def _GLOBAL(self):
-        return _global_manager
+        return get_manager()
 
 config_manager = _ConfigManagerNamespace()
 
-__all__ = ["ConfigManager", "get_config", "get_value", "config_manager"]
+__all__ = ["ConfigManager", "get_config", "get_manager", "get_value", "config_manager"]
 
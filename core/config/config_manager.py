@@ -1,4 +1,7 @@
+import functools
 import os
+import re
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 import importlib
@@ -24,16 +27,28 @@ def _mask_value(v: Any) -> Any:
     return s[:2] + "****" + s[-2:]
 
 
+_SENSITIVE_RE = re.compile("|".join(SENSITIVE_KEYS))
+
+
+@functools.lru_cache(maxsize=512)
+def _is_sensitive(key: str) -> bool:
+    return _SENSITIVE_RE.search(key.upper()) is not None
+
+
 def _mask_dict(d: Dict[str, Any]) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
-    for k, v in d.items():
-        if isinstance(v, dict):
-            out[k] = _mask_dict(v)
-        else:
-            if any(x in k.upper() for x in SENSITIVE_KEYS):
-                out[k] = _mask_value(v)
+    # Walk nested dicts with an explicit stack instead of recursing
+    stack = [(d, out)]
+    while stack:
+        src, dst = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, dict):
+                dst[k] = {}
+                stack.append((v, dst[k]))
+            elif _is_sensitive(str(k)):
+                dst[k] = _mask_value(v)
             else:
-                out[k] = v
+                dst[k] = v
     return out
 
 
@@ -43,7 +58,8 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
     try:
         yaml = importlib.import_module("yaml")
         with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(f, Loader=loader) or {}
         if isinstance(data, dict):
             return data
         return {}
@@ -59,19 +75,24 @@ def _load_dotenv(env_path: Path) -> None:
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> Dict[str, Any]:
+    # The environment is effectively immutable after startup; call
+    # ConfigManager.reload() to take a fresh snapshot
+    return {
+        k: v
+        for k, v in os.environ.items()
+        if k.startswith("FNOS_") or k in DEFAULT_ENV_KEYS
+    }
+
+
 def _collect_env(extra_keys: Optional[list] = None) -> Dict[str, Any]:
-    keys: set[str] = set(DEFAULT_ENV_KEYS)
-    for k in os.environ.keys():
-        if k.startswith("FNOS_"):
-            keys.add(k)
+    out = dict(_env_snapshot())
     if extra_keys:
         for k in extra_keys:
-            keys.add(k)
-    out: Dict[str, Any] = {}
-    for k in keys:
-        v = os.getenv(k)
-        if v is not None:
-            out[k] = v
+            v = os.getenv(k)
+            if v is not None:
+                out[k] = v
     return out
 
 
@@ -95,6 +116,21 @@ class ConfigManager:
         self.yaml_cfg = _load_yaml(self.yaml_path)
         self.env_cfg = _collect_env()
 
+    def reload(self) -> None:
+        """
+        Re-read .env, config.yaml and the environment snapshot in place.
+
+        Both dicts are rebuilt before being swapped in, so readers holding
+        this instance never see a half-loaded config.
+        """
+        with _RELOAD_LOCK:
+            _env_snapshot.cache_clear()
+            _load_dotenv(self.env_path)
+            yaml_cfg = _load_yaml(self.yaml_path)
+            env_cfg = _collect_env()
+            self.yaml_cfg, self.env_cfg = yaml_cfg, env_cfg
+            get_value.cache_clear()
+
     def to_dict(self, mask: bool = True) -> Dict[str, Any]:
         merged = {
             "yaml": self.yaml_cfg,
@@ -109,17 +145,25 @@ class ConfigManager:
 
 
 _GLOBAL: Optional[ConfigManager] = None
+_GLOBAL_LOCK = threading.Lock()
+_RELOAD_LOCK = threading.Lock()
 
 
-def get_config(mask: bool = True) -> Dict[str, Any]:
+def get_manager() -> ConfigManager:
+    """Get or create the process-wide ConfigManager."""
     global _GLOBAL
     if _GLOBAL is None:
-        _GLOBAL = ConfigManager()
-    return _GLOBAL.to_dict(mask=mask)
+        with _GLOBAL_LOCK:
+            if _GLOBAL is None:
+                _GLOBAL = ConfigManager()
+    return _GLOBAL
+
+
+def get_config(mask: bool = True) -> Dict[str, Any]:
+    return get_manager().to_dict(mask=mask)
 
 
+@functools.lru_cache(maxsize=256)
 def get_value(key: str, default: Any = None) -> Any:
-    global _GLOBAL
-    if _GLOBAL is None:
-        _GLOBAL = ConfigManager()
-    return _GLOBAL.get(key, default)
+    # Memoized; ConfigManager.reload() clears this cache
+    return get_manager().get(key, default)
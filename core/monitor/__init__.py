@@ -1,5 +1,6 @@
 from .cpu_monitor import CPUMonitor
 from .storage_monitor import StorageMonitor
 from .power_calc import PowerCalculator
+from .registry import get_monitors
 
-__all__ = ["CPUMonitor", "StorageMonitor", "PowerCalculator"]
+__all__ = ["CPUMonitor", "StorageMonitor", "PowerCalculator", "get_monitors"]
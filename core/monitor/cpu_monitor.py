@@ -1,6 +1,8 @@
 import psutil
+import functools
 import json
 import os
+import re
 import logging
 
 # Configure basic logging
@@ -8,6 +10,34 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _read_cpu_model():
+    """
+    Get CPU model for fnOS (Linux-based NAS) from /proc/cpuinfo.
+
+    The model cannot change while the process runs, so it is read once and
+    shared by every CPUMonitor.
+    """
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+        return "Unknown CPU"
+
+    except Exception as e:
+        logger.error(f"Failed to get CPU model: {e}")
+        return "Unknown CPU"
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_models(models):
+    # One alternation for all known models, longest first so the most
+    # specific name wins when several match at the same position
+    pattern = "|".join(re.escape(m) for m in sorted(models, key=len, reverse=True))
+    return re.compile(pattern)
+
+
 class CPUMonitor:
     def __init__(self, tdp_db_path=None):
         if tdp_db_path is None:
@@ -33,45 +63,14 @@ class CPUMonitor:
             return {}
 
     def _get_cpu_model(self):
-        """
-        Get CPU model for fnOS (Linux-based NAS).
-
-        This method is optimized for Linux systems.
-        """
-        try:
-            # Linux: Get CPU model from /proc/cpuinfo
-            with open("/proc/cpuinfo", "r") as f:
-                cpuinfo = f.read()
-
-            # Extract model name using grep
-            import subprocess
-            result = subprocess.run(
-                ["grep", "-m", "1", "-i", "^model name", cpuinfo],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip()
-
-            # Fallback: try to find 'model name' directly
-            for line in cpuinfo.split('\n'):
-                if line.startswith('model name'):
-                    return line.split(':', 1)[1].strip()
-
-            return "Unknown CPU"
-
-        except Exception as e:
-            logger.error(f"Failed to get CPU model: {e}")
-            return "Unknown CPU"
+        return _read_cpu_model()
 
     def _get_cpu_tdp(self):
         cpu_db = self.tdp_data.get("cpu", {})
-        # Simple string matching (can be improved with fuzzy match or regex)
-        for model, tdp in cpu_db.items():
-            if model in self.cpu_model:
-                return tdp
+        models = tuple(m for m in cpu_db if m != "default")
+        match = _compile_models(models).search(self.cpu_model) if models else None
+        if match:
+            return cpu_db[match.group(0)]
 
         logger.info(f"CPU model '{self.cpu_model}' not found in DB, using default.")
         return cpu_db.get("default", 15)
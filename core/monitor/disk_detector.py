@@ -2,33 +2,133 @@
 Disk type detection for Linux-based NAS systems.
 
 This module provides methods to detect disk types (HDD/SSD/NVMe) using:
-1. Linux /sys filesystem (preferred, no root required)
-2. lsblk command (medium reliability)
-3. smartctl command (requires root/privileged)
+1. Linux /sys rotational flag (preferred, no root required)
+2. Linux /sys device model/vendor strings (medium reliability)
+3. Device naming convention (fallback heuristic)
+
+All probes are plain reads of /sys pseudo-files; no external commands are
+spawned, so detection never wakes sleeping drives.
 
 For fnOS (Linux-based NAS), this should work with privileged Docker containers.
 """
+import glob
 import os
+import re
 import logging
-from typing import Dict, List, Optional, Tuple
-import subprocess
+import threading
+import time
+from collections import Counter
+from enum import IntEnum
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+_DEV_RE = re.compile(r"([a-z]+)\d*")
+
+# Virtual/stacked block devices (LVM/crypt, md RAID, optical, RAM disks).
+# Their rotational flag says nothing about a physical disk, so the fast
+# sysfs pass leaves them to the regular ladder
+_NON_DISK_PREFIXES = ("dm-", "md", "sr", "zram", "ram", "loop")
+
+# Model/vendor substrings that identify solid-state devices
+_SSD_MODEL_HINTS = ("SSD", "NVME", "SOLID STATE", "FLASH")
+
+
+def _read_sys_bytes(path: str, size: int) -> Optional[bytes]:
+    """
+    Read up to size bytes of a /sys attribute with a single unbuffered read.
+
+    Opens directly instead of checking os.path.exists first; a missing
+    attribute is the common case and costs one failed open().
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.debug(f"Could not open {path}: {e}")
+        return None
+    try:
+        return os.read(fd, size)
+    except OSError as e:
+        logger.debug(f"Could not read {path}: {e}")
+        return None
+    finally:
+        os.close(fd)
+
+
+def _read_sys_file(path: str) -> Optional[str]:
+    """Read a short text /sys attribute (model, vendor, ...)."""
+    buf = _read_sys_bytes(path, 256)
+    return None if buf is None else buf.decode("ascii", "replace").strip()
+
+
+def _read_rotational(path: str) -> Optional[bytes]:
+    # queue/rotational is always "0\n" or "1\n"
+    return _read_sys_bytes(path, 2)
+
+
+def _read_proc_partitions() -> List[str]:
+    """
+    List base block devices from /proc/partitions.
+
+    Partitions are folded into their parent (sda1 -> sda, nvme0n1p1 -> nvme0n1)
+    and loop devices are skipped. Returns an empty list if the file is unreadable.
+    """
+    try:
+        with open("/proc/partitions", "r") as f:
+            lines = f.read().splitlines()[2:]  # Skip header and blank line
+    except OSError:
+        return []
+
+    seen = {}
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 4:
+            continue
+        name = parts[3]
+        if name.startswith("loop"):
+            continue
+        if name.startswith(("nvme", "mmcblk")):
+            base, sep, tail = name.rpartition("p")
+            if sep and tail.isdigit():
+                name = base
+        else:
+            name = name.rstrip("0123456789") or name
+        seen[name] = None
+    return list(seen)
+
 
-class DiskType:
+class DiskType(IntEnum):
     """Disk type enumeration."""
-    UNKNOWN = "unknown"
-    HDD = "hdd"
-    SSD = "ssd"
-    NVME = "nvme"
+    UNKNOWN = 0
+    HDD = 1
+    SSD = 2
+    NVME = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in API output ('hdd', 'ssd', 'nvme', 'unknown')."""
+        return self.name.lower()
 
 
 class DiskDetector:
     """Detect disk types using multiple methods with fallback."""
 
-    def __init__(self):
-        self._cache = {}  # Cache detection results
+    def __init__(self, ttl: float = 60.0):
+        # Whole-scan result cache; disk topology rarely changes
+        self._result_cache: Optional[Dict[str, DiskType]] = None
+        # Per-device ladder results for devices the rotational scan missed
+        self._detect_cache: Dict[str, DiskType] = {}
+        self._result_ts = 0.0
+        self._ttl = ttl
+
+    def clear_cache(self) -> None:
+        """Forget all cached detection results."""
+        self._detect_cache.clear()
+        self._result_cache = None
+        self._result_ts = 0.0
 
     def detect_disk_types(self) -> Dict[str, str]:
         """
@@ -38,60 +138,111 @@ class DiskDetector:
             Dict mapping device names (sda, sdb, nvme0n1, etc.) to disk types
             Possible types: 'hdd', 'ssd', 'nvme', 'unknown'
         """
-        devices = self._get_all_devices()
-        results = {}
-
-        for device in devices:
-            # Normalize device name (e.g., sda from /dev/sda, nvme0n1 from /dev/nvme0n1)
-            device_name = self._normalize_device_name(device)
+        return {name: disk_type.label for name, disk_type in self._scan().items()}
+
+    def _scan(self) -> Dict[str, DiskType]:
+        """Detect all disks, reusing the previous scan within the TTL."""
+        now = time.monotonic()
+        if self._result_cache is not None and now - self._result_ts < self._ttl:
+            return self._result_cache
+
+        # One glob covers every device exposing a rotational flag
+        fast = self._fast_detect_all()
+
+        # Normalize device names (e.g., sda from /dev/sda, nvme0n1 from /dev/nvme0n1)
+        device_names = list(dict.fromkeys(self._normalize_device_name(d) for d in self._get_all_devices()))
+        results = {name: fast[name] for name in device_names if fast.get(name, DiskType.UNKNOWN) != DiskType.UNKNOWN}
+        residual = [name for name in device_names if name not in results]
+
+        # Each device only touches its own /sys entries, so probe them concurrently
+        if residual:
+            with ThreadPoolExecutor(max_workers=min(32, len(residual))) as ex:
+                for device_name, disk_type in zip(residual, ex.map(self._detect_one, residual)):
+                    results[device_name] = disk_type
+        results = {name: results[name] for name in device_names}
+
+        self._result_cache = results
+        self._result_ts = now
+        return results
 
-            # Check cache first
-            if device_name in self._cache:
-                results[device_name] = self._cache[device_name]
+    def _fast_detect_all(self) -> Dict[str, DiskType]:
+        """Classify every /sys/block device by its rotational flag in one pass."""
+        results: Dict[str, DiskType] = {}
+        for path in glob.iglob("/sys/block/*/queue/rotational"):
+            device = path.split("/")[3]
+            if device.startswith(_NON_DISK_PREFIXES):
                 continue
+            name = self._normalize_device_name(device)
+            if name in results:
+                continue
+            # Settled by name; virtio disks often report rotational=1
+            disk_type = self._type_from_name(name)
+            if disk_type is None:
+                disk_type = self._classify_rotational(device, _read_rotational(path))
+            results[name] = disk_type
+        return results
 
-            # Try detection methods in order of preference
-            disk_type = self._detect_by_sys_file(device_name)
-            if disk_type == DiskType.UNKNOWN:
-                disk_type = self._detect_by_lsblk(device_name)
-            if disk_type == DiskType.UNKNOWN:
-                disk_type = self._detect_by_smartctl(device_name)
-            if disk_type == DiskType.UNKNOWN:
-                disk_type = self._detect_by_naming(device_name)
-
-            # Cache and store result
-            self._cache[device_name] = disk_type
-            results[device_name] = disk_type
-
-            if disk_type != DiskType.UNKNOWN:
-                logger.info(f"Detected disk {device_name} as {disk_type}")
-            else:
-                logger.warning(f"Could not determine disk type for {device_name}")
+    def _detect_one(self, device_name: str) -> DiskType:
+        """Run the detection ladder for one device (memoized per device)."""
+        disk_type = self._detect_cache.get(device_name)
+        if disk_type is None:
+            disk_type = self._detect_cache[device_name] = self._detect_ladder(device_name)
+        return disk_type
+
+    def _detect_ladder(self, device_name: str) -> DiskType:
+        disk_type = self._type_from_name(device_name)
+        if disk_type is not None:
+            return disk_type
+
+        # Try detection methods in order of preference
+        disk_type = self._detect_by_sys_file(device_name)
+        if disk_type == DiskType.UNKNOWN:
+            disk_type = self._detect_by_sys_model(device_name)
+        if disk_type == DiskType.UNKNOWN:
+            disk_type = self._detect_by_naming(device_name)
+
+        if disk_type != DiskType.UNKNOWN:
+            logger.info(f"Detected disk {device_name} as {disk_type.label}")
+        else:
+            logger.warning(f"Could not determine disk type for {device_name}")
+        return disk_type
 
-        return results
+    def _type_from_name(self, device_name: str) -> Optional[DiskType]:
+        """Type implied by the device name alone (nvme*, virtio vd*), else None."""
+        if device_name.startswith("nvme"):
+            return DiskType.NVME
+        if device_name.startswith("vd"):
+            return DiskType.SSD
+        return None
 
     def _get_all_devices(self) -> List[str]:
         """Get all block devices in the system."""
-        devices = []
-
-        # Method 1: Scan /sys/block
-        sys_block = "/sys/block"
-        if os.path.exists(sys_block):
-            for device in os.listdir(sys_block):
-                # Skip partitions and loop devices
-                if not device.isdigit() and not device.startswith("loop"):
-                    devices.append(device)
+        # Method 1: /proc/partitions (one read lists every block device)
+        devices = _read_proc_partitions()
 
-        # Method 2: Scan /dev/ as fallback
+        # Method 2: Scan /sys/block
+        if not devices:
+            try:
+                with os.scandir("/sys/block") as it:
+                    # Skip partitions and loop devices
+                    devices = [
+                        e.name for e in it
+                        if not e.name.isdigit() and not e.name.startswith("loop")
+                    ]
+            except OSError:
+                pass
+
+        # Method 3: Scan /dev/ as fallback
         if not devices:
             try:
-                dev_entries = os.listdir("/dev")
-                for entry in dev_entries:
-                    # Include sd*, nvme*, vd* (common disk names)
-                    if any(entry.startswith(prefix) for prefix in ["sd", "nvme", "vd"]):
-                        # Skip partitions (e.g., sda1)
-                        if not any(c.isdigit() and c != entry[-1] for c in entry):
-                            devices.append(entry)
+                with os.scandir("/dev") as it:
+                    for entry in it:
+                        name = entry.name
+                        # Include sd*, nvme*, vd* (common disk names)
+                        if name.startswith(("sd", "nvme", "vd")):
+                            # Skip partitions (e.g., sda1)
+                            if not any(c.isdigit() and c != name[-1] for c in name):
+                                devices.append(name)
             except (PermissionError, OSError) as e:
                 logger.warning(f"Could not scan /dev: {e}")
 
@@ -109,159 +260,65 @@ class DiskDetector:
         """
         # Remove partition numbers
         # For nvme: nvme0n1 -> nvme0
-        if "n" in device:
-            idx = device.index("n")
-            return device[:idx]
+        if device.startswith("nvme"):
+            idx = device.find("n", 4)
+            return device[:idx] if idx != -1 else device
 
         # For regular: sda1 -> sda
-        import re
-        match = re.match(r"([a-z]+)[0-9]*", device)
+        match = _DEV_RE.match(device)
         if match:
             return match.group(1)
 
         return device
 
-    def _detect_by_sys_file(self, device: str) -> str:
+    def _detect_by_sys_file(self, device: str) -> DiskType:
         """
         Detect disk type using /sys filesystem (preferred method).
 
         This method does NOT require root privileges.
 
-        Checks /sys/block/<device>/queue/rotational
+        Checks /sys/class/block/<device>/queue/rotational
         - 0 = SSD (non-rotational)
         - 1 = HDD (rotational)
         - File not found = unknown
         """
-        sys_path = f"/sys/block/{device}/queue/rotational"
+        return self._classify_rotational(
+            device, _read_rotational(f"/sys/class/block/{device}/queue/rotational")
+        )
 
-        if not os.path.exists(sys_path):
+    def _classify_rotational(self, device: str, rotational: Optional[bytes]) -> DiskType:
+        if rotational is None:
             return DiskType.UNKNOWN
 
-        try:
-            with open(sys_path, "r") as f:
-                rotational = f.read().strip()
-
-            if rotational == "0":
-                # Check if it's NVMe
-                if device.startswith("nvme"):
-                    return DiskType.NVME
-                return DiskType.SSD
-            elif rotational == "1":
-                return DiskType.HDD
-            else:
-                logger.warning(f"Unexpected rotational value for {device}: {rotational}")
-                return DiskType.UNKNOWN
-
-        except (PermissionError, IOError) as e:
-            logger.debug(f"Could not read {sys_path}: {e}")
+        flag = rotational[:1]
+        if flag == b"0":
+            # Check if it's NVMe
+            if device.startswith("nvme"):
+                return DiskType.NVME
+            return DiskType.SSD
+        elif flag == b"1":
+            return DiskType.HDD
+        else:
+            logger.warning(f"Unexpected rotational value for {device}: {rotational!r}")
             return DiskType.UNKNOWN
 
-    def _detect_by_lsblk(self, device: str) -> str:
+    def _detect_by_sys_model(self, device: str) -> DiskType:
         """
-        Detect disk type using lsblk command.
-
-        This method usually works without root privileges
-        but may have limited output on some systems.
-
-        Checks ROTA (ROTATional) column:
-        - 0 = SSD/NVMe
-        - 1 = HDD
-        """
-        try:
-            # Run lsblk to get rotational info
-            result = subprocess.run(
-                ["lsblk", "-d", "-n", "-o", "NAME,ROTA"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode != 0:
-                logger.debug(f"lsblk failed: {result.stderr}")
-                return DiskType.UNKNOWN
-
-            # Parse output
-            for line in result.stdout.strip().split('\n'):
-                if line.startswith(device):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        rota = parts[1]
-                        if rota == "0":
-                            return DiskType.NVME if device.startswith("nvme") else DiskType.SSD
-                        elif rota == "1":
-                            return DiskType.HDD
-
-            return DiskType.UNKNOWN
-
-        except FileNotFoundError:
-            logger.debug("lsblk command not found")
-            return DiskType.UNKNOWN
-        except subprocess.TimeoutExpired:
-            logger.warning("lsblk command timed out")
-            return DiskType.UNKNOWN
-        except Exception as e:
-            logger.debug(f"lsblk error: {e}")
-            return DiskType.UNKNOWN
+        Detect disk type from the device model/vendor strings in /sys.
 
-    def _detect_by_smartctl(self, device: str) -> str:
+        Used when the rotational flag is missing. Only recognizes
+        solid-state devices; anything else is reported as unknown.
         """
-        Detect disk type using smartctl command.
-
-        This method REQUIRES root privileges or privileged container.
+        base = f"/sys/class/block/{device}/device"
+        ident = " ".join(
+            v for v in (_read_sys_file(f"{base}/vendor"), _read_sys_file(f"{base}/model")) if v
+        ).upper()
 
-        Checks if device is rotational.
-        - non-rotational = SSD/NVMe
-        - rotational = HDD
-
-        Note: This requires /dev/sda, /dev/sdb, etc. as input.
-        """
-        # Map device name to /dev path
-        dev_path = f"/dev/{device}"
-
-        # For NVMe, need to strip partition
-        if "n" in device:
-            idx = device.index("n")
-            dev_path = f"/dev/{device[:idx]}"
-
-        try:
-            # Run smartctl with -a (all) flag
-            result = subprocess.run(
-                ["smartctl", "-a", dev_path],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 1:
-                # Access denied or permission error
-                logger.warning(f"smartctl access denied for {dev_path}")
-                return DiskType.UNKNOWN
-
-            if result.returncode != 0:
-                logger.debug(f"smartctl failed for {dev_path}: {result.stderr}")
-                return DiskType.UNKNOWN
-
-            # Check for "Rotation Rate" in output
-            if "Rotation Rate:" in result.stdout:
-                # Has rotation rate = HDD
-                return DiskType.SSD  # Smartctl can't distinguish, treat as SSD
-            elif "non-rotational" in result.stdout or "SSD" in result.stdout:
-                return DiskType.NVME if device.startswith("nvme") else DiskType.SSD
-            else:
-                # No rotation rate mentioned, likely SSD/NVMe
-                return DiskType.NVME if device.startswith("nvme") else DiskType.SSD
-
-        except FileNotFoundError:
-            logger.debug("smartctl command not found")
-            return DiskType.UNKNOWN
-        except subprocess.TimeoutExpired:
-            logger.warning("smartctl command timed out")
-            return DiskType.UNKNOWN
-        except Exception as e:
-            logger.debug(f"smartctl error for {dev_path}: {e}")
-            return DiskType.UNKNOWN
+        if any(hint in ident for hint in _SSD_MODEL_HINTS):
+            return DiskType.NVME if device.startswith("nvme") else DiskType.SSD
+        return DiskType.UNKNOWN
 
-    def _detect_by_naming(self, device: str) -> str:
+    def _detect_by_naming(self, device: str) -> DiskType:
         """
         Detect disk type based on naming convention (fallback method).
 
@@ -281,6 +338,25 @@ class DiskDetector:
         else:
             return DiskType.UNKNOWN
 
+    def _compute_summary(self) -> Dict[str, any]:
+        """Classify all detected disks in a single pass."""
+        disk_types = self._scan()
+        c = Counter(disk_types.values())
+        total = len(disk_types)
+
+        return {
+            "total_disks": total,
+            "known_types": total - c[DiskType.UNKNOWN],
+            "unknown_types": c[DiskType.UNKNOWN],
+            "by_type": {
+                "hdd": c[DiskType.HDD],
+                "ssd": c[DiskType.SSD],
+                "nvme": c[DiskType.NVME],
+                "unknown": c[DiskType.UNKNOWN],
+            },
+            "devices": {name: disk_type.label for name, disk_type in disk_types.items()}
+        }
+
     def get_disk_counts(self) -> Dict[str, int]:
         """
         Get counts of each disk type.
@@ -288,21 +364,11 @@ class DiskDetector:
         Returns:
             Dict with keys: 'hdd', 'ssd', 'nvme'
         """
-        disk_types = self.detect_disk_types()
-        counts = {
-            DiskType.HDD: 0,
-            DiskType.SSD: 0,
-            DiskType.NVME: 0
-        }
-
-        for disk_type in disk_types.values():
-            if disk_type in counts:
-                counts[disk_type] += 1
-
+        by_type = self._compute_summary()["by_type"]
         return {
-            'hdd': counts[DiskType.HDD],
-            'ssd': counts[DiskType.SSD],
-            'nvme': counts[DiskType.NVME]
+            'hdd': by_type["hdd"],
+            'ssd': by_type["ssd"],
+            'nvme': by_type["nvme"]
         }
 
     def get_detection_summary(self) -> Dict[str, any]:
@@ -312,32 +378,19 @@ class DiskDetector:
         Returns:
             Dict with detection method results and statistics.
         """
-        disk_types = self.detect_disk_types()
-        total = len(disk_types)
-        known = sum(1 for t in disk_types.values() if t != DiskType.UNKNOWN)
-
-        return {
-            "total_disks": total,
-            "known_types": known,
-            "unknown_types": total - known,
-            "by_type": {
-                "hdd": sum(1 for t in disk_types.values() if t == DiskType.HDD),
-                "ssd": sum(1 for t in disk_types.values() if t == DiskType.SSD),
-                "nvme": sum(1 for t in disk_types.values() if t == DiskType.NVME),
-                "unknown": sum(1 for t in disk_types.values() if t == DiskType.UNKNOWN),
-            },
-            "devices": disk_types
-        }
+        return self._compute_summary()
 
 
-# Global detector instance
-_disk_detector = None
+_DETECTOR: Optional[DiskDetector] = None
+_DETECTOR_LOCK = threading.Lock()
 
 
 def get_disk_detector() -> DiskDetector:
     """Get or create the global disk detector instance."""
-    global _disk_detector
-    if _disk_detector is None:
-        _disk_detector = DiskDetector()
-        logger.info("Disk detector initialized")
-    return _disk_detector
+    global _DETECTOR
+    if _DETECTOR is None:
+        with _DETECTOR_LOCK:
+            if _DETECTOR is None:
+                _DETECTOR = DiskDetector()
+                logger.info("Disk detector initialized")
+    return _DETECTOR
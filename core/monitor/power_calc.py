@@ -7,36 +7,114 @@ This module calculates system power consumption with the following priority:
 """
 import logging
 import os
+import threading
+import time
+from dataclasses import dataclass
 from typing import Dict, Optional, Any
 
-from core.monitor.cpu_monitor import CPUMonitor
-from core.monitor.storage_monitor import StorageMonitor
-from .disk_detector import get_disk_detector, DiskType
+import psutil
+
+from .cpu_monitor import CPUMonitor
+from .storage_monitor import StorageMonitor
+from .disk_detector import get_disk_detector
 
-# Configure basic logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _env_float(key: str) -> Optional[float]:
+    """Read a float from the environment; unset or empty gives None."""
+    v = os.environ.get(key)
+    if v in (None, ""):
+        return None
+    return float(v)
+
+
+@dataclass(frozen=True, slots=True)
+class PowerConfig:
+    """User TDP overrides from the environment; None means use the TDP DB."""
+    cpu_tdp: Optional[float]
+    hdd_idle: Optional[float]
+    hdd_active: Optional[float]
+    ssd: Optional[float]
+    nvme: Optional[float]
+    mem_stick: Optional[float]
+    power_source: str
+
+
+def _load_power_config() -> PowerConfig:
+    return PowerConfig(
+        cpu_tdp=_env_float("HARDWARE_TDP_CPU"),
+        hdd_idle=_env_float("HARDWARE_TDP_HDD_IDLE"),
+        hdd_active=_env_float("HARDWARE_TDP_HDD_ACTIVE"),
+        ssd=_env_float("HARDWARE_TDP_SSD"),
+        nvme=_env_float("HARDWARE_TDP_NVME"),
+        mem_stick=_env_float("HARDWARE_TDP_MEMORY"),
+        power_source=os.getenv("HA_POWER_SOURCE", "internal").lower(),
+    )
+
+
+# Resolved once at import; the environment does not change at runtime
+_CONFIG = _load_power_config()
+
+
+def _pick(override: Optional[float], default: float) -> float:
+    return override if override is not None else float(default)
+
+
+class _CpuSampler:
+    """
+    Background CPU usage sampler shared by all PowerCalculator instances.
+
+    Calls psutil.cpu_percent(interval=None) every SAMPLE_INTERVAL seconds so
+    power estimates can read the latest value without blocking.
+    """
+
+    SAMPLE_INTERVAL = 2.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="cpu-sampler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        psutil.cpu_percent(interval=None)  # Prime the delta baseline
+        while True:
+            time.sleep(self.SAMPLE_INTERVAL)
+            try:
+                self.store(psutil.cpu_percent(interval=None))
+            except Exception as e:
+                logger.debug(f"CPU sampling failed: {e}")
+
+    def store(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def latest(self) -> Optional[float]:
+        with self._lock:
+            return self._value
+
+
+_CPU_SAMPLER = _CpuSampler()
+
+
 class PowerCalculator:
     def __init__(self, cpu_monitor=None, storage_monitor=None):
         self.cpu_monitor = cpu_monitor if cpu_monitor else CPUMonitor()
         self.storage_monitor = storage_monitor if storage_monitor else StorageMonitor()
         self.disk_detector = get_disk_detector()
+        _CPU_SAMPLER.start()
 
         # Load constants from TDP DB or use defaults
         self.tdp_data = self.cpu_monitor.tdp_data  # Reusing the loaded DB
         self.base_system_power = self.tdp_data.get('base_system', 10)
 
-        # Load hardware TDP from config (user configurable)
-        # These override the TDP DB if user provides values
-        self.cpu_tdp = os.getenv("HARDWARE_TDP_CPU", "")
-        self.hdd_idle_power = os.getenv("HARDWARE_TDP_HDD_IDLE", "")
-        self.hdd_active_power = os.getenv("HARDWARE_TDP_HDD_ACTIVE", "")
-        self.ssd_power = os.getenv("HARDWARE_TDP_SSD", "")
-        self.nvme_power = os.getenv("HARDWARE_TDP_NVME", "")
-        self.memory_power = os.getenv("HARDWARE_TDP_MEMORY", "")
-
         self.disk_power_map = self.tdp_data.get('disk', {
             "default_hdd": 6.5,
             "default_ssd": 2.5,
@@ -44,21 +122,26 @@ class PowerCalculator:
             "idle_hdd": 0.8
         })
 
-        # Use configured values if provided, otherwise use defaults
-        self.hdd_idle = float(self.hdd_idle_power) if self.hdd_idle_power else self.disk_power_map.get('default_hdd', 6.5)
-        self.hdd_active = float(self.hdd_active_power) if self.hdd_active_power else self.disk_power_map.get('default_hdd', 6.5)
-        self.ssd = float(self.ssd_power) if self.ssd_power else self.disk_power_map.get('default_ssd', 2.5)
-        self.nvme = float(self.nvme_power) if self.nvme_power else self.disk_power_map.get('default_nvme', 3.5)
-        self.mem_stick = float(self.memory_power) if self.memory_power else self.tdp_data.get('memory', {}).get('ddr4_stick', 3.0)
+        # Hardware TDP from config (user configurable)
+        # These override the TDP DB if user provides values
+        self.cfg = _CONFIG
+        self.cpu_tdp = self.cfg.cpu_tdp
+        self.hdd_idle = _pick(self.cfg.hdd_idle, self.disk_power_map.get('default_hdd', 6.5))
+        self.hdd_active = _pick(self.cfg.hdd_active, self.disk_power_map.get('default_hdd', 6.5))
+        self.ssd = _pick(self.cfg.ssd, self.disk_power_map.get('default_ssd', 2.5))
+        self.nvme = _pick(self.cfg.nvme, self.disk_power_map.get('default_nvme', 3.5))
+        self._disk_power_active = (self.hdd_active, self.ssd, self.nvme)
+        self._disk_power_idle = (self.hdd_idle, self.ssd, self.nvme)
+        self.mem_stick = _pick(self.cfg.mem_stick, self.tdp_data.get('memory', {}).get('ddr4_stick', 3.0))
 
         # Determine if external monitoring is configured
-        self.power_source = os.getenv("HA_POWER_SOURCE", "internal").lower()
+        self.power_source = self.cfg.power_source
         logger.info(f"Power source configured: {self.power_source}")
 
     def _get_tdp_cpu(self) -> float:
         """Get CPU TDP from user config or default."""
-        if self.cpu_tdp:
-            return float(self.cpu_tdp)
+        if self.cpu_tdp is not None:
+            return self.cpu_tdp
         # Fallback to DB or default
         return float(self.cpu_monitor.cpu_tdp if hasattr(self.cpu_monitor, 'cpu_tdp') else 15)
 
@@ -71,7 +154,10 @@ class PowerCalculator:
         Assuming idle power is roughly 20% of TDP.
         """
         if usage_percent is None:
-            usage_percent = self.cpu_monitor.get_cpu_usage(interval=0.1)  # Non-blocking roughly
+            usage_percent = _CPU_SAMPLER.latest()
+            if usage_percent is None:
+                # No background sample yet; take one short blocking sample
+                usage_percent = self.refresh_now()
 
         cpu_tdp = self._get_tdp_cpu()
         idle_ratio = 0.2
@@ -80,6 +166,12 @@ class PowerCalculator:
         estimated_power = cpu_tdp * (idle_ratio + active_ratio * (usage_percent / 100.0))
         return round(estimated_power, 2)
 
+    def refresh_now(self) -> float:
+        """Take a fresh CPU usage sample now (blocks ~0.1s) and publish it."""
+        usage = self.cpu_monitor.get_cpu_usage(interval=0.1)
+        _CPU_SAMPLER.store(usage)
+        return usage
+
     def estimate_disk_power(self, disk_count_hdd=0, disk_count_ssd=0, disk_count_nvme=0, active=True) -> float:
         """
         Estimate disk power based on counts and types.
@@ -93,21 +185,9 @@ class PowerCalculator:
         Returns:
             Estimated power in watts
         """
-        power = 0
-
-        # HDD Power
-        hdd_power_unit = self.hdd_active if active else self.hdd_idle
-        power += disk_count_hdd * hdd_power_unit
-
-        # SSD Power (SATA)
-        ssd_power_unit = self.ssd
-        power += disk_count_ssd * ssd_power_unit
-
-        # NVMe Power
-        nvme_power_unit = self.nvme
-        power += disk_count_nvme * nvme_power_unit
-
-        return power
+        # Per-unit power for (HDD, SATA SSD, NVMe)
+        p = self._disk_power_active if active else self._disk_power_idle
+        return disk_count_hdd * p[0] + disk_count_ssd * p[1] + disk_count_nvme * p[2]
 
     def estimate_total_power(
         self,
@@ -153,8 +233,13 @@ class PowerCalculator:
         if disk_config is None:
             # Auto-detect disk types using DiskDetector
             try:
-                disk_counts = self.disk_detector.get_disk_counts()
                 detection_summary = self.disk_detector.get_detection_summary()
+                by_type = detection_summary['by_type']
+                disk_counts = {
+                    'hdd': by_type['hdd'],
+                    'ssd': by_type['ssd'],
+                    'nvme': by_type['nvme']
+                }
 
                 if detection_summary['unknown_types'] > 0:
                     logger.warning(
@@ -0,0 +1,27 @@
+import threading
+from typing import Optional, Tuple
+
+from .cpu_monitor import CPUMonitor
+from .storage_monitor import StorageMonitor
+from .power_calc import PowerCalculator
+
+# Process-wide monitor instances, created on first use
+_MONITORS: Optional[Tuple[CPUMonitor, StorageMonitor, PowerCalculator]] = None
+_MONITORS_LOCK = threading.Lock()
+
+
+def get_monitors() -> Tuple[CPUMonitor, StorageMonitor, PowerCalculator]:
+    """
+    Get the shared (cpu, storage, power) monitors.
+
+    The /monitor and /ha endpoints and the daily report all use these, so
+    the TDP DB, disk detection and sampling state exist once per process.
+    """
+    global _MONITORS
+    if _MONITORS is None:
+        with _MONITORS_LOCK:
+            if _MONITORS is None:
+                cpu = CPUMonitor()
+                storage = StorageMonitor()
+                _MONITORS = (cpu, storage, PowerCalculator(cpu, storage))
+    return _MONITORS
@@ -1,10 +1,84 @@
+import os
 import psutil
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for all mounts' usage before skipping the slow ones
+USAGE_TIMEOUT = 2.0
+
+# Shared, bounded pool for statvfs calls. A mount whose previous query is
+# still stuck reuses that future instead of queueing another one, so hung
+# mounts hold at most one thread each.
+_USAGE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="disk-usage")
+_PENDING_USAGE: Dict[str, Future] = {}
+_PENDING_LOCK = threading.Lock()
+
+SKIP_FSTYPES = frozenset((
+    "tmpfs",
+    "devtmpfs",
+    "proc",
+    "sysfs",
+    "devfs",
+    "overlay",
+    "aufs",
+    "squashfs",
+))
+
+IO_FIELDS = ("read_bytes", "write_bytes", "read_count", "write_count")
+
+
+def _io_dict(counters):
+    return {field: getattr(counters, field) for field in IO_FIELDS}
+
+
+_DISKSTATS_FD = None
+_SECTOR_SIZE = 512
+
+
+def _read_diskstats():
+    """
+    Parse /proc/diskstats into {name: {read_bytes, write_bytes, read_count, write_count}}.
+
+    The file descriptor is kept open and re-read with pread. Returns None when
+    /proc/diskstats is unavailable (non-Linux), so callers can fall back to psutil.
+    Note: the kernel does not account io_uring passthrough I/O here, so
+    counters may undercount for such workloads.
+    """
+    global _DISKSTATS_FD
+    try:
+        if _DISKSTATS_FD is None:
+            _DISKSTATS_FD = os.open("/proc/diskstats", os.O_RDONLY)
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(_DISKSTATS_FD, 65536, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+    except OSError:
+        return None
+
+    stats = {}
+    for line in b"".join(chunks).decode("ascii", "replace").splitlines():
+        f = line.split()
+        if len(f) < 11:
+            continue
+        # Fields: major minor name reads merged sectors ms writes merged sectors ms ...
+        stats[f[2]] = {
+            "read_bytes": int(f[5]) * _SECTOR_SIZE,
+            "write_bytes": int(f[9]) * _SECTOR_SIZE,
+            "read_count": int(f[3]),
+            "write_count": int(f[7]),
+        }
+    return stats
+
 
 class StorageMonitor:
     def __init__(self):
@@ -41,49 +115,31 @@ class StorageMonitor:
         Get disk I/O statistics.
         """
         try:
+            stats = _read_diskstats()
+            if stats is not None:
+                if perdisk:
+                    return stats
+                # Sum whole disks only; partitions are already counted in their parent
+                disks = set(os.listdir("/sys/block")) if os.path.isdir("/sys/block") else set(stats)
+                total = dict.fromkeys(IO_FIELDS, 0)
+                for name, c in stats.items():
+                    if name in disks:
+                        for field in IO_FIELDS:
+                            total[field] += c[field]
+                return total
+
             io = psutil.disk_io_counters(perdisk=perdisk)
             if io is None:
                 return {}
-            if perdisk:
-                if isinstance(io, dict):
-                    result = {}
-                    for disk, counters in io.items():
-                        result[disk] = {
-                            "read_bytes": counters.read_bytes,
-                            "write_bytes": counters.write_bytes,
-                            "read_count": counters.read_count,
-                            "write_count": counters.write_count,
-                        }
-                    return result
-                else:
-                    counters = io
-                    return {
-                        "read_bytes": counters.read_bytes,
-                        "write_bytes": counters.write_bytes,
-                        "read_count": counters.read_count,
-                        "write_count": counters.write_count,
-                    }
-            else:
-                if isinstance(io, dict):
-                    total = {
-                        "read_bytes": 0,
-                        "write_bytes": 0,
-                        "read_count": 0,
-                        "write_count": 0,
-                    }
-                    for counters in io.values():
-                        total["read_bytes"] += counters.read_bytes
-                        total["write_bytes"] += counters.write_bytes
-                        total["read_count"] += counters.read_count
-                        total["write_count"] += counters.write_count
-                    return total
-                else:
-                    return {
-                        "read_bytes": io.read_bytes,
-                        "write_bytes": io.write_bytes,
-                        "read_count": io.read_count,
-                        "write_count": io.write_count,
-                    }
+            if isinstance(io, dict):
+                if perdisk:
+                    return {disk: _io_dict(c) for disk, c in io.items()}
+                total = dict.fromkeys(IO_FIELDS, 0)
+                for c in io.values():
+                    for field in IO_FIELDS:
+                        total[field] += getattr(c, field)
+                return total
+            return _io_dict(io)
         except Exception as e:
             logger.error(f"Failed to get IO counters: {e}")
             return {}
@@ -93,26 +149,46 @@ class StorageMonitor:
         Get a summary of storage status.
         """
         partitions = self.get_partitions()
-        overview = []
+        selected = []
+        seen_devices = set()
         for p in partitions:
             # Filter for physical devices (approximate)
             if "loop" in p.device:
                 continue
 
             # Skip pseudo filesystems
-            skip_types = {
-                "tmpfs",
-                "devtmpfs",
-                "proc",
-                "sysfs",
-                "devfs",
-                "overlay",
-                "aufs",
-                "squashfs",
-            }
-            if p.fstype in skip_types:
+            if p.fstype in SKIP_FSTYPES:
+                continue
+
+            # Dedup by device: bind mounts and extra mounts of the same device
+            # (btrfs subvolumes) report the same usage, so keep only the first
+            # mountpoint. /proc/mounts never lists a "bind" option to filter on.
+            if p.device in seen_devices:
+                continue
+            seen_devices.add(p.device)
+            selected.append(p)
+
+        if not selected:
+            return []
+
+        # statvfs can block on sleeping disks or stale network mounts, so query
+        # mounts concurrently and give up on any not done by one shared deadline
+        futures = []
+        with _PENDING_LOCK:
+            for p in selected:
+                future = _PENDING_USAGE.get(p.mountpoint)
+                if future is None or future.done():
+                    future = _USAGE_POOL.submit(self.get_disk_usage, p.mountpoint)
+                    _PENDING_USAGE[p.mountpoint] = future
+                futures.append((p, future))
+        wait([f for _, f in futures], timeout=USAGE_TIMEOUT)
+
+        overview = []
+        for p, future in futures:
+            if not future.done():
+                logger.warning(f"Timed out getting disk usage for {p.mountpoint}")
                 continue
-            usage = self.get_disk_usage(p.mountpoint)
+            usage = future.result()
             if usage:
                 overview.append(
                     {
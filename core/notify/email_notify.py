@@ -1,7 +1,15 @@
+import asyncio
+import functools
+import importlib
 import os
+import queue
 import smtplib
 import ssl
 import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Tuple, Dict
 from email.mime.text import MIMEText
 from email.utils import formataddr
@@ -10,93 +18,314 @@ from .base_notify import BaseNotify
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_ssl_context() -> ssl.SSLContext:
+    # Loading the CA bundle is expensive; one default context serves every send
+    return ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=8)
+def _from_header(email_from: str) -> str:
+    return formataddr(("fnOS Overseer", email_from))
+
+
+@functools.lru_cache(maxsize=64)
+def _to_header(recipients: Tuple[str, ...]) -> str:
+    return ", ".join(recipients)
+
+
+# Authenticated SMTP connections kept alive between sends, keyed by
+# (host, port, user, tls). Connections are retired after _POOL_MAX_AGE
+# seconds or _POOL_MAX_USES messages, whichever comes first.
+_POOL_MAX_AGE = 100.0
+_POOL_MAX_USES = 100
+_POOL: Dict[Tuple[str, int, str, bool], "queue.LifoQueue[_PooledSMTP]"] = {}
+_POOL_LOCK = threading.Lock()
+# send_batch hands the connection back to the pool every _BATCH_CHUNK messages
+_BATCH_CHUNK = 50
+
+
+class _PooledSMTP:
+    __slots__ = ("server", "created_at", "uses")
+
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+    def expired(self) -> bool:
+        return (
+            time.monotonic() - self.created_at > _POOL_MAX_AGE
+            or self.uses >= _POOL_MAX_USES
+        )
+
+
+def _close_quietly(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+def _pool_queue(key: Tuple[str, int, str, bool]) -> "queue.LifoQueue[_PooledSMTP]":
+    with _POOL_LOCK:
+        q = _POOL.get(key)
+        if q is None:
+            q = _POOL[key] = queue.LifoQueue()
+        return q
+
+
+def _pool_acquire(key: Tuple[str, int, str, bool]) -> Optional[_PooledSMTP]:
+    """Pop a live pooled connection, or None if a new one has to be opened."""
+    q = _pool_queue(key)
+    while True:
+        try:
+            conn = q.get_nowait()
+        except queue.Empty:
+            return None
+        if not conn.expired():
+            try:
+                if conn.server.noop()[0] == 250:
+                    return conn
+            except (smtplib.SMTPException, OSError):
+                pass
+        _close_quietly(conn.server)
+
+
+def _pool_release(key: Tuple[str, int, str, bool], conn: _PooledSMTP) -> None:
+    """Reset the session and return the connection to the pool if still usable."""
+    if conn.expired():
+        _close_quietly(conn.server)
+        return
+    try:
+        conn.server.rset()
+    except (smtplib.SMTPException, OSError):
+        _close_quietly(conn.server)
+        return
+    _pool_queue(key).put(conn)
+
+
+# Async sends are capped per SMTP host so one slow server cannot hold the loop.
+# Semaphores are bound to the event loop they are used on, so keep a set per loop.
+_ASYNC_HOST_LIMIT = 10
+_ASYNC_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _host_semaphore(host: str) -> asyncio.Semaphore:
+    per_loop = _ASYNC_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    sem = per_loop.get(host)
+    if sem is None:
+        sem = per_loop[host] = asyncio.Semaphore(_ASYNC_HOST_LIMIT)
+    return sem
+
+
+@dataclass(frozen=True, slots=True)
+class SmtpConfig:
+    """SMTP settings from the environment. Fields tagged with an env name are required."""
+    host: str = field(metadata={"env": "SMTP_HOST"})
+    port: int = field(metadata={"env": "SMTP_PORT"})
+    user: str = field(metadata={"env": "SMTP_USER"})
+    password: str = field(metadata={"env": "SMTP_PASS"})
+    email_from: str = field(metadata={"env": "EMAIL_FROM"})
+    email_to: str = field(metadata={"env": "EMAIL_TO"})
+    tls: bool
+    # EMAIL_TO split once into the default recipient list
+    recipients: Tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_smtp_config() -> SmtpConfig:
+    # Cleared by the config API after .env is rewritten
+    user = os.getenv("SMTP_USER", "")
+    email_to = os.getenv("EMAIL_TO", "")
+    return SmtpConfig(
+        host=os.getenv("SMTP_HOST", ""),
+        port=int(os.getenv("SMTP_PORT", "0") or "0"),
+        user=user,
+        password=os.getenv("SMTP_PASS", ""),
+        email_from=os.getenv("EMAIL_FROM", user or ""),
+        email_to=email_to,
+        tls=os.getenv("SMTP_TLS", "true").lower() in ("1", "true", "yes", "on"),
+        recipients=tuple(x.strip() for x in email_to.split(",") if x.strip()),
+    )
+
+
 class EmailNotify(BaseNotify):
     def __init__(self):
-        self.smtp_host = os.getenv("SMTP_HOST", "")
-        self.smtp_port = int(os.getenv("SMTP_PORT", "0") or "0")
-        self.smtp_user = os.getenv("SMTP_USER", "")
-        self.smtp_pass = os.getenv("SMTP_PASS", "")
-        self.smtp_tls = os.getenv("SMTP_TLS", "true").lower() in (
-            "1",
-            "true",
-            "yes",
-            "on",
-        )
-        self.email_from = os.getenv("EMAIL_FROM", self.smtp_user or "")
-        self.email_to_env = os.getenv("EMAIL_TO", "")
+        self.cfg = _load_smtp_config()
 
     def validate_config(self) -> Tuple[bool, List[str]]:
-        missing = []
-        if not self.smtp_host:
-            missing.append("SMTP_HOST")
-        if not self.smtp_port:
-            missing.append("SMTP_PORT")
-        if not self.smtp_user:
-            missing.append("SMTP_USER")
-        if not self.smtp_pass:
-            missing.append("SMTP_PASS")
-        if not self.email_from:
-            missing.append("EMAIL_FROM")
-        if not self.email_to_env:
-            missing.append("EMAIL_TO")
+        missing = [
+            f.metadata["env"]
+            for f in fields(self.cfg)
+            if "env" in f.metadata and not getattr(self.cfg, f.name)
+        ]
         return (len(missing) == 0, missing)
 
-    def _parse_recipients(self, to: Optional[List[str]]) -> List[str]:
-        if to and len(to) > 0:
-            return to
-        if not self.email_to_env:
-            return []
-        return [x.strip() for x in self.email_to_env.split(",") if x.strip()]
-
-    def send(self, subject: str, content: str, to: Optional[List[str]] = None) -> bool:
-        # Validate configuration first
+    def _prepare(self, to: Optional[List[str]]) -> Optional[List[str]]:
+        """Validate configuration and resolve recipients; None if sending is impossible."""
         ok, missing = self.validate_config()
         if not ok:
             logger.error(f"Email configuration incomplete. Missing: {', '.join(missing)}")
-            return False
+            return None
 
-        recipients = self._parse_recipients(to)
+        recipients = list(to) if to else list(self.cfg.recipients)
         if not recipients:
             logger.error("No valid recipients found")
-            return False
+            return None
+        return recipients
 
+    def _build_message(self, subject: str, content: str, recipients: List[str]) -> MIMEText:
         msg = MIMEText(content, "plain", "utf-8")
         msg["Subject"] = subject
-        msg["From"] = formataddr(("fnOS Overseer", self.email_from))
-        msg["To"] = ", ".join(recipients)
+        msg["From"] = _from_header(self.cfg.email_from)
+        msg["To"] = _to_header(tuple(recipients))
+        return msg
 
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        implicit_ssl = self.cfg.tls and self.cfg.port == 465
+        if implicit_ssl:
+            # Use SMTP_SSL for port 465 (implicit SSL)
+            logger.debug(f"Connecting to SMTP server {self.cfg.host}:{self.cfg.port} (SSL)")
+            server = smtplib.SMTP_SSL(
+                self.cfg.host, self.cfg.port, context=_get_ssl_context(), timeout=30
+            )
+        else:
+            # Use regular SMTP with optional STARTTLS
+            logger.debug(f"Connecting to SMTP server {self.cfg.host}:{self.cfg.port}")
+            server = smtplib.SMTP(self.cfg.host, self.cfg.port, timeout=30)
         try:
-            if self.smtp_tls and self.smtp_port == 465:
-                # Use SMTP_SSL for port 465 (implicit SSL)
-                context = ssl.create_default_context()
-                with smtplib.SMTP_SSL(
-                    self.smtp_host, self.smtp_port, context=context, timeout=30
-                ) as server:
-                    logger.debug(f"Connecting to SMTP server {self.smtp_host}:{self.smtp_port} (SSL)")
-                    server.login(self.smtp_user, self.smtp_pass)
-                    server.sendmail(self.email_from, recipients, msg.as_string())
-                    logger.info(f"Email sent successfully to {recipients}")
-            else:
-                # Use regular SMTP with optional STARTTLS
-                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
-                    logger.debug(f"Connecting to SMTP server {self.smtp_host}:{self.smtp_port}")
+            if not implicit_ssl:
+                server.ehlo()
+                if self.cfg.tls:
+                    server.starttls(context=_get_ssl_context())
                     server.ehlo()
-                    if self.smtp_tls:
-                        server.starttls(context=ssl.create_default_context())
-                        server.ehlo()
-                    server.login(self.smtp_user, self.smtp_pass)
-                    server.sendmail(self.email_from, recipients, msg.as_string())
-                    logger.info(f"Email sent successfully to {recipients}")
+            server.login(self.cfg.user, self.cfg.password)
+        except Exception:
+            _close_quietly(server)
+            raise
+        return server
+
+    def send(self, subject: str, content: str, to: Optional[List[str]] = None) -> bool:
+        # Validate configuration first
+        recipients = self._prepare(to)
+        if recipients is None:
+            return False
+
+        msg = self._build_message(subject, content, recipients)
+
+        key = (self.cfg.host, self.cfg.port, self.cfg.user, self.cfg.tls)
+        conn = None
+        try:
+            conn = _pool_acquire(key) or _PooledSMTP(self._connect())
+            conn.server.send_message(msg, self.cfg.email_from, recipients)
+            conn.uses += 1
+            logger.info(f"Email sent successfully to {recipients}")
+            _pool_release(key, conn)
             return True
-        except smtplib.SMTPAuthenticationError as e:
+        except Exception as e:
+            self._log_send_error(e)
+        if conn is not None:
+            _close_quietly(conn.server)
+        return False
+
+    def send_batch(
+        self, messages: List[Tuple[str, str, Optional[List[str]]]]
+    ) -> List[bool]:
+        """
+        Send several (subject, content, to) messages over one pooled connection.
+
+        Messages go out in chunks of 50; the connection is handed back to the
+        pool between chunks. A failed message closes the connection and the
+        next one reconnects.
+
+        Returns:
+            One success flag per message, in input order
+        """
+        key = (self.cfg.host, self.cfg.port, self.cfg.user, self.cfg.tls)
+        results: List[bool] = []
+        for start in range(0, len(messages), _BATCH_CHUNK):
+            conn = None
+            for subject, content, to in messages[start:start + _BATCH_CHUNK]:
+                recipients = self._prepare(to)
+                if recipients is None:
+                    results.append(False)
+                    continue
+                msg = self._build_message(subject, content, recipients)
+                try:
+                    if conn is not None and conn.expired():
+                        _pool_release(key, conn)
+                        conn = None
+                    if conn is None:
+                        conn = _pool_acquire(key) or _PooledSMTP(self._connect())
+                    conn.server.send_message(msg, self.cfg.email_from, recipients)
+                    conn.uses += 1
+                    logger.info(f"Email sent successfully to {recipients}")
+                    results.append(True)
+                except Exception as e:
+                    self._log_send_error(e)
+                    if conn is not None:
+                        _close_quietly(conn.server)
+                        conn = None
+                    results.append(False)
+            if conn is not None:
+                _pool_release(key, conn)
+        return results
+
+    def _log_send_error(self, e: Exception) -> None:
+        if isinstance(e, smtplib.SMTPAuthenticationError):
             logger.error(f"SMTP authentication failed: {e}")
-        except smtplib.SMTPConnectError as e:
-            logger.error(f"Failed to connect to SMTP server {self.smtp_host}:{self.smtp_port}: {e}")
-        except smtplib.SMTPException as e:
+        elif isinstance(e, smtplib.SMTPConnectError):
+            logger.error(f"Failed to connect to SMTP server {self.cfg.host}:{self.cfg.port}: {e}")
+        elif isinstance(e, smtplib.SMTPException):
             logger.error(f"SMTP error occurred: {e}")
-        except ConnectionRefusedError as e:
+        elif isinstance(e, ConnectionRefusedError):
             logger.error(f"Connection refused by SMTP server: {e}")
-        except TimeoutError as e:
+        elif isinstance(e, TimeoutError):
+            logger.error(f"SMTP connection timed out: {e}")
+        else:
+            logger.error(f"Unexpected error sending email: {e}", exc_info=True)
+
+    async def send_async(self, subject: str, content: str, to: Optional[List[str]] = None) -> bool:
+        """
+        Send an email without blocking the event loop.
+
+        Uses aiosmtplib (imported on first use). At most 10 sends per SMTP
+        host run concurrently on a given event loop.
+        """
+        recipients = self._prepare(to)
+        if recipients is None:
+            return False
+
+        msg = self._build_message(subject, content, recipients)
+        aiosmtplib = importlib.import_module("aiosmtplib")
+        implicit_ssl = self.cfg.tls and self.cfg.port == 465
+        smtp = aiosmtplib.SMTP(
+            hostname=self.cfg.host,
+            port=self.cfg.port,
+            use_tls=implicit_ssl,
+            start_tls=self.cfg.tls and not implicit_ssl,
+            tls_context=_get_ssl_context() if self.cfg.tls else None,
+            timeout=30,
+        )
+        try:
+            async with _host_semaphore(self.cfg.host):
+                async with smtp:
+                    await smtp.login(self.cfg.user, self.cfg.password)
+                    await smtp.send_message(msg, sender=self.cfg.email_from, recipients=recipients)
+            logger.info(f"Email sent successfully to {recipients}")
+            return True
+        except aiosmtplib.SMTPAuthenticationError as e:
+            logger.error(f"SMTP authentication failed: {e}")
+        except aiosmtplib.SMTPConnectError as e:
+            logger.error(f"Failed to connect to SMTP server {self.cfg.host}:{self.cfg.port}: {e}")
+        except aiosmtplib.SMTPException as e:
+            logger.error(f"SMTP error occurred: {e}")
+        except asyncio.TimeoutError as e:
             logger.error(f"SMTP connection timed out: {e}")
         except Exception as e:
             logger.error(f"Unexpected error sending email: {e}", exc_info=True)
@@ -1,6 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from typing import Optional, Dict, Any
-from core.monitor import CPUMonitor, StorageMonitor, PowerCalculator
+from typing import Optional, Dict, Any, Iterator, Tuple
+from core.monitor import get_monitors
 
 try:
     from adapter.fnos import log_parser as fnos_log_parser
@@ -9,37 +10,41 @@ except Exception:
 
 class DailyReportBuilder:
     def __init__(self):
-        self.cpu_monitor = CPUMonitor()
-        self.storage_monitor = StorageMonitor()
-        self.power_calc = PowerCalculator(self.cpu_monitor, self.storage_monitor)
+        self.cpu_monitor, self.storage_monitor, self.power_calc = get_monitors()
 
     def build(self, for_date: Optional[date] = None) -> Dict[str, Any]:
+        return dict(self.build_stream(for_date))
+
+    def build_stream(self, for_date: Optional[date] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the report sections as (name, value) pairs as soon as each is ready.
+
+        Sections come in template order: meta, cpu, power, storage, logs.
+        """
         now = datetime.now()
         d = for_date or now.date()
-        cpu_info = self.cpu_monitor.get_cpu_info()
-        cpu_usage = self.cpu_monitor.get_cpu_usage(interval=0.5)
-        power = self.power_calc.estimate_total_power(cpu_usage_percent=cpu_usage)
-        storage = self.storage_monitor.get_storage_overview()
-        logs = {"login_events": [], "user_actions": []}
-        if fnos_log_parser:
-            try:
-                logs["login_events"] = fnos_log_parser.parse_login_events(d)
-            except Exception:
-                logs["login_events"] = []
-            try:
-                logs["user_actions"] = fnos_log_parser.parse_user_actions(d)
-            except Exception:
-                logs["user_actions"] = []
-        return {
-            "meta": {
-                "date": d.isoformat(),
-                "generated_at": now.isoformat()
-            },
-            "cpu": {
+        yield "meta", {
+            "date": d.isoformat(),
+            "generated_at": now.isoformat()
+        }
+        # The CPU sample sleeps, storage stats every mount and the logs come
+        # over HTTP; none depend on each other, so run them side by side
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            f_usage = ex.submit(self.cpu_monitor.get_cpu_usage, 0.5)
+            f_storage = ex.submit(self.storage_monitor.get_storage_overview)
+            f_logs = ex.submit(fnos_log_parser.parse_all, d) if fnos_log_parser else None
+            cpu_info = self.cpu_monitor.get_cpu_info()
+            cpu_usage = f_usage.result()
+            yield "cpu", {
                 "info": cpu_info,
                 "usage_percent": cpu_usage
-            },
-            "power": power,
-            "storage": storage,
-            "logs": logs
-        }
+            }
+            yield "power", self.power_calc.estimate_total_power(cpu_usage_percent=cpu_usage)
+            yield "storage", f_storage.result()
+            logs = {"login_events": [], "user_actions": []}
+            if f_logs is not None:
+                try:
+                    logs.update(f_logs.result())
+                except Exception:
+                    pass
+            yield "logs", logs
@@ -1,7 +1,60 @@
 from pathlib import Path
 from datetime import date
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterable, Optional, Tuple, Union
+import functools
 import importlib
+import threading
+from core.utils import atomic_open
+
+
+@functools.lru_cache(maxsize=4)
+def _get_template(template_path: str):
+    """Compile a report template once per process."""
+    jinja2 = importlib.import_module("jinja2")
+    path = Path(template_path)
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(path.parent)),
+        autoescape=jinja2.select_autoescape(["html"]),
+        # Templates ship with the app; skip the mtime check on every render
+        auto_reload=False,
+    )
+    return env.get_template(path.name)
+
+
+class _PendingReport(dict):
+    """
+    Report data filled in by a producer thread.
+
+    Lookups block until the requested section arrives (or the producer
+    finishes), so a template can render while the data is still being built.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._cond = threading.Condition()
+        self._done = False
+        self.error: Optional[BaseException] = None
+
+    def fill(self, sections: Iterable[Tuple[str, Any]]) -> None:
+        try:
+            for key, value in sections:
+                with self._cond:
+                    dict.__setitem__(self, key, value)
+                    self._cond.notify_all()
+        except BaseException as e:
+            self.error = e
+        finally:
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    def __getitem__(self, key):
+        with self._cond:
+            self._cond.wait_for(lambda: self._done or dict.__contains__(self, key))
+            # A section missing because the producer failed: surface that failure
+            if self.error is not None and not dict.__contains__(self, key):
+                raise self.error
+        return dict.__getitem__(self, key)
 
 
 class StaticReportRenderer:
@@ -26,22 +79,57 @@ class StaticReportRenderer:
         )
 
     def render(self, data: Dict[str, Any]) -> str:
-        jinja2 = importlib.import_module("jinja2")
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(self.template_path.parent)),
-            autoescape=jinja2.select_autoescape(["html"]),
-        )
-        tpl = env.get_template(self.template_path.name)
-        return tpl.render(data=data)
+        return _get_template(str(self.template_path)).render(data=data)
 
-    def save(self, data: Dict[str, Any], filename: Optional[str] = None) -> Path:
-        html = self.render(data)
+    def _output_path(self, meta: Dict[str, Any], filename: Optional[str]) -> Path:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         if filename is None:
-            d = data.get("meta", {}).get("date")
+            d = meta.get("date")
             if not d:
                 d = date.today().isoformat()
             filename = f"report_{d}.html"
-        out_path = self.output_dir / filename
-        out_path.write_text(html, encoding="utf-8")
+        return self.output_dir / filename
+
+    def save(self, data: Dict[str, Any], filename: Optional[str] = None) -> Path:
+        out_path = self._output_path(data.get("meta", {}), filename)
+        # Stream chunks straight to disk instead of building the whole page in memory
+        with atomic_open(out_path, buffering=1 << 16) as f:
+            _get_template(str(self.template_path)).stream(data=data).dump(f)
+        return out_path
+
+    def save_stream(
+        self, sections: Iterable[Tuple[str, Any]], filename: Optional[str] = None
+    ) -> Path:
+        """
+        Render a report while its sections are still being produced.
+
+        Args:
+            sections: (name, value) pairs, e.g. DailyReportBuilder.build_stream();
+                consumed on a background thread, "meta" expected first
+
+        Returns:
+            Path of the written report. Nothing is written if producing fails.
+        """
+        data = _PendingReport()
+        producer = threading.Thread(
+            target=data.fill, args=(sections,), name="report-build", daemon=True
+        )
+        producer.start()
+        try:
+            meta = data["meta"]
+        except KeyError:
+            meta = {}
+        out_path = self._output_path(meta, filename)
+        with atomic_open(out_path, buffering=1 << 16) as f:
+            try:
+                _get_template(str(self.template_path)).stream(data=data).dump(f)
+            except Exception:
+                # A render error caused by a failed producer reports the producer's error
+                producer.join()
+                if data.error is not None:
+                    raise data.error
+                raise
+            producer.join()
+            if data.error is not None:
+                raise data.error
         return out_path
@@ -1,5 +1,5 @@
 # Scheduled task management
-from .scheduler import create_scheduler, start
+from .scheduler import create_scheduler, start, start_exclusive
 from .tasks import run_daily_report
 
-__all__ = ["create_scheduler", "start", "run_daily_report"]
+__all__ = ["create_scheduler", "start", "start_exclusive", "run_daily_report"]
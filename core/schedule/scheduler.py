@@ -1,21 +1,43 @@
-import importlib
+import functools
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Tuple, Union
 from zoneinfo import ZoneInfo
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from core.schedule.tasks import run_daily_report
 from core.config.config_manager import get_value
 
+logger = logging.getLogger(__name__)
+
+# "HH:MM"; as lenient as int() on each side (whitespace, one-digit fields)
+_TIME_RE = re.compile(r"^\s*(\d+)\s*:\s*(\d+)\s*$")
+
+
+@functools.lru_cache(maxsize=8)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_report_time(value: str) -> Tuple[int, int]:
+    match = _TIME_RE.match(value)
+    if not match:
+        # Fallback to default if parsing fails
+        return 0, 30
+    return int(match.group(1)), int(match.group(2))
+
+
 def create_scheduler(timezone: str = "Asia/Shanghai"):
-    tz = ZoneInfo(timezone) if timezone else None
+    tz = _tz(timezone) if timezone else None
     scheduler = BackgroundScheduler(timezone=tz)
 
     # Read report time from config
-    report_time_str = get_value("schedule.report_time", "08:00")
-    try:
-        hour, minute = map(int, report_time_str.split(":"))
-    except (ValueError, AttributeError):
-        # Fallback to default if parsing fails
-        hour, minute = 0, 30
+    hour, minute = _parse_report_time(str(get_value("schedule.report_time", "08:00")))
 
     trigger = CronTrigger(hour=hour, minute=minute, timezone=tz)
     scheduler.add_job(run_daily_report, trigger, id="daily_report", replace_existing=True)
@@ -25,3 +47,60 @@ def start():
     scheduler = create_scheduler()
     scheduler.start()
     return scheduler
+
+
+# Held for the life of the process once this process owns the scheduler
+_LOCK_FD = None
+
+
+def _try_lock(lock_path: Path) -> bool:
+    global _LOCK_FD
+    import fcntl
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    _LOCK_FD = fd
+    return True
+
+
+def start_exclusive(lock_path: Union[str, Path], retry_interval: float = 60.0) -> threading.Thread:
+    """
+    Start the scheduler in only one of several processes (e.g. gunicorn workers).
+
+    Each process runs a daemon thread that tries a non-blocking flock on
+    lock_path; the one holding it starts the scheduler. If that process
+    exits, the lock is released and another process takes over on its
+    next attempt.
+
+    Args:
+        lock_path: Lock file shared by all processes
+        retry_interval: Seconds between attempts while another process holds the lock
+
+    Returns:
+        The thread competing for the lock
+    """
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def run():
+        global _LOCK_FD
+        while True:
+            try:
+                if _try_lock(lock_path):
+                    start()
+                    logger.info(f"Scheduler started in process {os.getpid()}")
+                    return
+            except Exception as e:
+                logger.error(f"Scheduler failed to start: {e}", exc_info=True)
+                # Let another process try instead of holding an idle lock
+                if _LOCK_FD is not None:
+                    os.close(_LOCK_FD)
+                    _LOCK_FD = None
+            time.sleep(retry_interval)
+
+    t = threading.Thread(target=run, name="scheduler-leader", daemon=True)
+    t.start()
+    return t
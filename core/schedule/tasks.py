@@ -2,5 +2,5 @@ from core.report.daily_report import DailyReportBuilder
 from core.report.static_renderer import StaticReportRenderer
 
 def run_daily_report():
-    data = DailyReportBuilder().build()
-    StaticReportRenderer().save(data)
+    # Render while the builder is still sampling CPU and fetching logs
+    StaticReportRenderer().save_stream(DailyReportBuilder().build_stream())
@@ -0,0 +1,4 @@
+# Filesystem helpers
+from .fs import atomic_open, atomic_write_text
+
+__all__ = ["atomic_open", "atomic_write_text"]
@@ -0,0 +1,38 @@
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+
+@contextlib.contextmanager
+def atomic_open(path: Union[str, Path], buffering: int = -1) -> Iterator[IO[str]]:
+    """
+    Open a UTF-8 text file for writing that replaces path atomically.
+
+    Data goes to a temporary file in the same directory, which is fsynced
+    once and renamed over path when the block exits cleanly. On error the
+    temporary file is removed and path is left untouched.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; keep the mode of the file being replaced
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp, 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=buffering) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def atomic_write_text(path: Union[str, Path], data: str) -> None:
+    with atomic_open(path) as f:
+        f.write(data)
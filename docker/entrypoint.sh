@@ -8,4 +8,5 @@ mkdir -p logs data/reports
 # Currently not required as fnOS_Overseer doesn't use external databases
 
 echo "Starting fnOS_Overseer..."
-exec python -u web/backend/main.py
+# Production server; python web/backend/main.py still works for local runs
+exec gunicorn -c gunicorn.conf.py wsgi:app
@@ -0,0 +1,15 @@
+"""
+Gunicorn settings for the production entrypoint (gunicorn -c gunicorn.conf.py wsgi:app).
+
+Blocking I/O (fnOS / HA lookups, SMTP) dominates request time, so run two
+workers per core, each with a few threads.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("GUNICORN_WORKERS", "0") or "0") or 2 * multiprocessing.cpu_count()
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+accesslog = "-"
+
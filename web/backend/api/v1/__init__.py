@@ -1,10 +1,38 @@
+import functools
 import importlib
+import os
 from web.backend.models.data_models import ok, err
 from core.auth import require_super_admin, require_api_token
+from core.config.config_manager import get_manager
 
 from flask import Blueprint, jsonify
 
 bp = Blueprint("api_v1", __name__, url_prefix="/api/v1")
 
-# Register API routes - Import after bp definition to avoid circular import
-from . import config, monitor, report, webhook, ha
+# Route modules attach their views to bp when imported
+_ROUTE_MODULES = ("config", "monitor", "report", "webhook", "ha")
+
+
+def ha_enabled() -> bool:
+    """
+    Whether the Home Assistant endpoints (/ha/*) should answer.
+
+    On unless HA_ENABLED is explicitly set to a false value, so existing
+    installs keep their HA sensors. Read per call, so toggling it from the
+    config page takes effect without a restart.
+    """
+    # Make sure .env has been loaded into the environment
+    get_manager()
+    return os.getenv("HA_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+@functools.lru_cache(maxsize=1)
+def register_routes() -> Blueprint:
+    """
+    Import the v1 route modules and return the populated blueprint.
+
+    Must run before the blueprint is registered on an app.
+    """
+    for name in _ROUTE_MODULES:
+        importlib.import_module(f"{__name__}.{name}")
+    return bp
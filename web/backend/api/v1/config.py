@@ -1,8 +1,16 @@
+import copy
+import functools
 import importlib
-from web.backend.api.v1 import bp, require_super_admin
-from core.config import ConfigManager
+import os
+import re
+import sys
+from web.backend.api.v1 import bp, ha_enabled, require_super_admin
+from core.config import get_manager
+from core.notify.email_notify import _load_smtp_config
+from core.utils import atomic_write_text
 from web.backend.models.data_models import ok, err
 from pathlib import Path
+from typing import Dict
 
 from flask import request, jsonify
 
@@ -33,11 +41,72 @@ HA_ENV_PREFIXES = [
     'EXTERNAL_POWER_POLL_INTERVAL'
 ]
 
+# Keys starting with one of these go to .env, everything else to config.yaml
+# SMTP, EMAIL, FNOS, Home Assistant, Hardware TDP
+ENV_PREFIXES = (
+    "SMTP_", "EMAIL_", "FNOS_", "HA_", "MQTT_",
+    "HARDWARE_TDP_", "EXTERNAL_", "API_"
+)
+# Only this much of a key is needed to match a prefix
+_ENV_PREFIX_LEN = max(len(p) for p in ENV_PREFIXES)
+
+
+def _set_dotted(target: dict, key: str, value) -> None:
+    """Assign value at a dot-notation path (e.g. performance.collect_interval)."""
+    *parents, leaf = key.split(".")
+    for p in parents:
+        child = target.get(p)
+        if not isinstance(child, dict):
+            child = target[p] = {}
+        target = child
+    target[leaf] = value
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    # Imported on the first config write, then reused
+    return importlib.import_module("yaml")
+
+
+def _yaml_dump(data: dict) -> str:
+    yaml = _yaml()
+    # Prefer the libyaml emitter when PyYAML was built with it
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, allow_unicode=True, sort_keys=False)
+
+
+_ENV_LINE_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+
+def _format_env(key: str, value: str) -> str:
+    # Same quoting as dotenv.set_key
+    escaped = value.replace("'", "\\'")
+    return f"{key}='{escaped}'"
+
+
+def _write_env(env_path: Path, updates: Dict[str, str]) -> None:
+    """Apply updates to .env with a single read and write, keeping comments and order."""
+    lines = env_path.read_text(encoding="utf-8").splitlines() if env_path.exists() else []
+    pending = dict(updates)
+    for i, line in enumerate(lines):
+        m = _ENV_LINE_RE.match(line)
+        if m and m.group(1) in updates:
+            lines[i] = _format_env(m.group(1), updates[m.group(1)])
+            pending.pop(m.group(1), None)
+    lines.extend(_format_env(k, v) for k, v in pending.items())
+    atomic_write_text(env_path, "\n".join(lines) + "\n")
+
+
+def _with_ha_state(cfg: dict) -> dict:
+    # The config page shows the effective HA switch, including the default
+    cfg["env"] = {**cfg.get("env", {}), "HA_ENABLED": "true" if ha_enabled() else "false"}
+    return cfg
+
 
 @bp.get("/config")
 @require_super_admin
 def get_cfg():
-    return jsonify(ok(ConfigManager().get_config(mask=True)))
+    return jsonify(ok(_with_ha_state(get_manager().to_dict(mask=True))))
 
 
 @bp.post("/config")
@@ -47,47 +116,37 @@ def update_cfg():
     if not isinstance(data, dict):
         return jsonify(err(400, "bad_request")), 400
 
-    cm = ConfigManager()
+    cm = get_manager()
     yaml_path = cm.yaml_path
     env_path = cm.env_path
 
-    # Define prefixes for keys that should go to .env
-    # SMTP, EMAIL, FNOS, Home Assistant, Hardware TDP
-    env_prefixes = (
-        "SMTP_", "EMAIL_", "FNOS_", "HA_", "MQTT_",
-        "HARDWARE_TDP_", "EXTERNAL_", "API_"
-    )
-
-    yaml_updates = {}
-    env_updates = {}
-
-    for k, v in data.items():
-        if not isinstance(k, str):
-            continue
-
-        # Check if key belongs to .env
-        if k.upper().startswith(env_prefixes):
-            env_updates[k] = v
-        else:
-            # Assume it belongs to yaml
-            yaml_updates[k] = v
+    env_updates = {
+        k: v for k, v in data.items()
+        if isinstance(k, str) and k[:_ENV_PREFIX_LEN].upper().startswith(ENV_PREFIXES)
+    }
+    yaml_updates = {
+        k: v for k, v in data.items()
+        if isinstance(k, str) and k not in env_updates
+    }
 
     try:
-        # Update .env using dotenv
+        # Update .env in one rewrite
         if env_updates:
-            dotenv = importlib.import_module("dotenv")
-            # Create .env if not exists
-            if not env_path.exists():
-                env_path.touch()
+            env_values = {k: str(v) for k, v in env_updates.items()}
+            _write_env(env_path, env_values)
+            os.environ.update(env_values)
 
-            for k, v in env_updates.items():
-                dotenv.set_key(env_path, k, str(v))
+            # Email settings are cached per process; pick up the new values
+            _load_smtp_config.cache_clear()
+            # Same for the HA routes, if they are registered
+            ha_routes = sys.modules.get("web.backend.api.v1.ha")
+            if ha_routes is not None:
+                ha_routes._refresh_env()
 
         # Update config.yaml
         if yaml_updates:
-            import yaml as _yaml
-
-            current_yaml = cm.yaml_cfg if isinstance(cm.yaml_cfg, dict) else {}
+            # Work on a copy; cm is shared with other requests until reload()
+            current_yaml = copy.deepcopy(cm.yaml_cfg) if isinstance(cm.yaml_cfg, dict) else {}
 
             # Handle hardware_tdp section specially
             if 'hardware_tdp' in yaml_updates or any(k.startswith('HARDWARE_TDP_') for k in yaml_updates):
@@ -95,29 +154,21 @@ def update_cfg():
                     current_yaml['hardware_tdp'] = {}
 
             for k, v in yaml_updates.items():
-                # Handle dot notation for nested keys (e.g. performance.collect_interval)
                 if "." in k:
-                    parts = k.split(".")
-                    target = current_yaml
-                    for p in parts[:-1]:
-                        if p not in target or not isinstance(target[p], dict):
-                            target[p] = {}
-                        target = target[p]
-                    target[parts[-1]] = v
+                    _set_dotted(current_yaml, k, v)
                 else:
                     # Top-level keys
                     current_yaml[k] = v
 
-            yaml_path.write_text(
-                _yaml.safe_dump(current_yaml, allow_unicode=True, sort_keys=False),
-                encoding="utf-8",
+            atomic_write_text(
+                yaml_path,
+                _yaml_dump(current_yaml),
             )
 
-        # Reload config manager
-        from core.config import ConfigManager
-        _GLOBAL = ConfigManager()
+        # Refresh the shared config manager once both files are written
+        cm.reload()
 
-        return jsonify(ok(_GLOBAL.get_config(mask=True)))
+        return jsonify(ok(_with_ha_state(cm.to_dict(mask=True))))
 
     except Exception as e:
         import logging
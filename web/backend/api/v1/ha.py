@@ -6,45 +6,90 @@ RESTful Sensor platform. It exposes system metrics in a format that
 Home Assistant can consume.
 """
 
+import asyncio
+import functools
+import hashlib
 import importlib
 import logging
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Any, Optional, Tuple
 import json as json_lib
 
-from flask import request, jsonify
-from web.backend.api.v1 import bp
-from core.auth import require_api_token
-from web.backend.models.data_models import ok
-from core.monitor import CPUMonitor, StorageMonitor, PowerCalculator
+import requests
+from flask import Response, current_app, request, jsonify
+from web.backend.api.v1 import bp, ha_enabled
+from core.auth import auth_config, require_api_token
+from web.backend.models.data_models import ok, err
+from core.monitor import get_monitors
 
 logger = logging.getLogger(__name__)
 
-# Global instances (cached for performance)
-_monitor_cache = {
-    "last_update": 0,
-    "cpu_monitor": None,
-    "storage_monitor": None,
-    "power_calculator": None,
-}
+# Same monitor instances as the /monitor endpoints, so CPU sampling state
+# and the disk detector are shared
+_CPU_MONITOR, _STORAGE_MONITOR, _POWER_CALC = get_monitors()
 
 
-def _get_monitor_components():
-    """Initialize or get cached monitor components."""
-    if _monitor_cache["last_update"] == 0 or _monitor_cache["cpu_monitor"] is None:
+_HA_PATH_PREFIX = f"{bp.url_prefix}/ha/"
 
-        _monitor_cache["cpu_monitor"] = CPUMonitor()
-        _monitor_cache["storage_monitor"] = StorageMonitor()
-        _monitor_cache["power_calculator"] = PowerCalculator(
-            _monitor_cache["cpu_monitor"], _monitor_cache["storage_monitor"]
-        )
-        _monitor_cache["last_update"] = 1
 
-    return (
-        _monitor_cache["cpu_monitor"],
-        _monitor_cache["storage_monitor"],
-        _monitor_cache["power_calculator"],
-    )
+@bp.before_request
+def _ha_gate():
+    # bp hooks run for every v1 route; only the HA ones are switchable
+    if request.path.startswith(_HA_PATH_PREFIX) and not ha_enabled():
+        return jsonify(err(404, "ha_disabled")), 404
+    return None
+
+
+def _sensor_cache_ttl() -> float:
+    try:
+        return float(os.getenv("HA_SENSOR_CACHE_TTL", "5"))
+    except ValueError:
+        return 5.0
+
+
+# Sensor readings shared across HA polls: key -> (monotonic timestamp, value)
+_SENSOR_CACHE_TTL = _sensor_cache_ttl()
+_sensor_cache: Dict[str, Tuple[float, Any]] = {}
+_sensor_locks: Dict[str, threading.Lock] = {}
+
+
+def _cached(key: str, producer: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for key if younger than HA_SENSOR_CACHE_TTL seconds.
+
+    Concurrent misses on the same key wait for a single producer call.
+    """
+    entry = _sensor_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _SENSOR_CACHE_TTL:
+        return entry[1]
+    with _sensor_locks.setdefault(key, threading.Lock()):
+        entry = _sensor_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _SENSOR_CACHE_TTL:
+            return entry[1]
+        value = producer()
+        _sensor_cache[key] = (time.monotonic(), value)
+        return value
+
+
+# External HA power source, resolved once at import (see _refresh_env)
+_HA_ENTITY_POWER = ""
+_HA_API_URL = ""
+_HA_HEADERS: Dict[str, str] = {}
+# Keep-alive connections to the HA API; fail fast on connect, allow a slower read
+_HA_SESSION = requests.Session()
+_HA_TIMEOUT = (1, 3)
+
+# Blocking sensor work for the async views. Flask runs each async view on
+# its own short-lived event loop, so persistent threads (and the pooled HA
+# session above) outlive any single loop.
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ha-io")
+# The external HA fetch can take seconds; it gets its own small pool so a
+# slow HA instance cannot tie up the threads the local sensor reads run on
+_HA_FETCH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ha-fetch")
 
 
 def _get_external_power() -> Optional[float]:
@@ -60,21 +105,11 @@ def _get_external_power() -> Optional[float]:
         Power value in watts, or None if external source not configured.
     """
     # Check if HA sensors are configured
-    ha_entity_power = os.getenv("HA_ENTITY_POWER", "")
-    ha_api_url = os.getenv("HA_API_URL", "http://supervisor/core/api")
-
-    if ha_entity_power and ha_api_url:
+    if _HA_ENTITY_POWER and _HA_API_URL:
         try:
             # Call Home Assistant API to get sensor state
-            import requests
-
-            headers = {
-                "Authorization": f"Bearer {os.getenv('HA_API_TOKEN', '')}",
-                "Content-Type": "application/json",
-            }
-
-            url = f"{ha_api_url}/states/{ha_entity_power}"
-            response = requests.get(url, headers=headers, timeout=5)
+            url = f"{_HA_API_URL}/states/{_HA_ENTITY_POWER}"
+            response = _HA_SESSION.get(url, headers=_HA_HEADERS, timeout=_HA_TIMEOUT)
 
             if response.status_code == 200:
                 data = response.json()
@@ -89,16 +124,85 @@ def _get_external_power() -> Optional[float]:
                     ):
                         return float(attributes.get("state", 0))
 
-            logger.warning(f"HA sensor fetch failed: {response.status_code}")
+            logger.warning("HA sensor fetch failed: %s", response.status_code)
 
         except Exception as e:
-            logger.debug(f"External power fetch error: {e}")
+            logger.debug("External power fetch error: %s", e)
 
     return None
 
 
+# (epoch second, ISO string) of the last timestamp handed out
+_last_ts: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Local time as an ISO string, at one-second resolution.
+
+    HA polls several endpoints within the same second; they share one
+    formatted string instead of each building a datetime.
+    """
+    global _last_ts
+    sec = int(time.time())
+    cached = _last_ts
+    if cached[0] != sec:
+        cached = _last_ts = (sec, datetime.fromtimestamp(sec).isoformat())
+    return cached[1]
+
+
+def _storage_totals(storage) -> Tuple[float, float]:
+    """Sum total_gb and used_gb over the storage overview in one pass."""
+    total_gb = 0.0
+    used_gb = 0.0
+    for s in storage:
+        u = s["usage"]
+        total_gb += u["total_gb"]
+        used_gb += u["used_gb"]
+    return total_gb, used_gb
+
+
+@functools.lru_cache(maxsize=1)
+def _msgpack():
+    """msgpack module for ?format=msgpack, or None when it is not installed."""
+    try:
+        return importlib.import_module("msgpack")
+    except ImportError:
+        return None
+
+
+def _conditional(response: Response, etag_source: Any) -> Response:
+    """
+    Tag response with an ETag derived from etag_source.
+
+    Returns 304 Not Modified (no body) when the request's If-None-Match
+    already carries that tag.
+    """
+    body = current_app.json.dumps(etag_source).encode()
+    response.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest())
+    return response.make_conditional(request)
+
+
+async def _run_blocking(
+    func: Callable[..., Any], *args: Any, executor: ThreadPoolExecutor = _IO_POOL
+) -> Any:
+    """Run a blocking call on an I/O pool without holding the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+async def _external_power() -> Optional[float]:
+    """
+    External power reading, fetched on the dedicated HA pool.
+
+    Goes through the sensor cache, so concurrent polls share one HA request.
+    """
+    return await _run_blocking(
+        _cached, "external_power", _get_external_power, executor=_HA_FETCH_POOL
+    )
+
+
 @bp.get("/ha/power")
-def ha_power():
+async def ha_power():
     """
     Get total power consumption.
 
@@ -115,13 +219,14 @@ def ha_power():
         device_class: power
     ```
     """
+    ts = _now_iso()
     try:
         # Try to get external power first
-        external_power = _get_external_power()
+        external_power = await _external_power()
 
         if external_power is not None:
             # Use external monitoring data
-            logger.debug(f"Using external power: {external_power}W")
+            logger.debug("Using external power: %sW", external_power)
             return jsonify(
                 ok(
                     {
@@ -131,18 +236,14 @@ def ha_power():
                             "friendly_name": "fnOS Overseer Total Power",
                             "source": "external_monitoring",
                         },
-                        "last_updated": importlib.import_module("datetime")
-                        .datetime.now()
-                        .isoformat(),
+                        "last_updated": ts,
                     }
                 )
             )
 
         # Fall back to internal estimation
-        cpu_monitor, storage_monitor, power_calc = _get_monitor_components()
-
         # Get power calculation
-        power_result = power_calc.estimate_total_power()
+        power_result = await _run_blocking(_cached, "power", _POWER_CALC.estimate_total_power)
         total_watts = power_result["total_watts"]
         breakdown = power_result["breakdown"]
         disk_counts = power_result.get("disk_counts", {})
@@ -161,9 +262,7 @@ def ha_power():
                         "memory_watts": breakdown["memory"],
                         "disk_counts": disk_counts,
                     },
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
+                    "last_updated": ts,
                 }
             )
         )
@@ -175,9 +274,7 @@ def ha_power():
                 {
                     "state": 0,
                     "attributes": {"unit_of_measurement": "W", "error": str(e)},
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
+                    "last_updated": ts,
                 }
             )
         )
@@ -190,12 +287,11 @@ def ha_cpu():
 
     Compatible with Home Assistant REST Sensor.
     """
+    ts = _now_iso()
     try:
-        cpu_monitor, _, _ = _get_monitor_components()
-
-        cpu_info = cpu_monitor.get_cpu_info()
-        cpu_usage = cpu_monitor.get_cpu_usage(interval=0.2)
-        cpu_power = cpu_monitor.estimate_cpu_power(cpu_usage)
+        cpu_info = _CPU_MONITOR.get_cpu_info()
+        cpu_usage = _cached("cpu_usage", lambda: _CPU_MONITOR.get_cpu_usage(interval=0.2))
+        cpu_power = _CPU_MONITOR.estimate_cpu_power(cpu_usage)
 
         return jsonify(
             ok(
@@ -210,9 +306,7 @@ def ha_cpu():
                         "frequency_mhz": cpu_info.get("frequency_current", 0),
                         "power_watts": cpu_power,
                     },
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
+                    "last_updated": ts,
                 }
             )
         )
@@ -224,9 +318,7 @@ def ha_cpu():
                 {
                     "state": 0,
                     "attributes": {"unit_of_measurement": "%", "error": str(e)},
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
+                    "last_updated": ts,
                 }
             )
         )
@@ -239,33 +331,26 @@ def ha_storage():
 
     Compatible with Home Assistant REST Sensor.
     """
+    ts = _now_iso()
     try:
-        _, storage_monitor, _ = _get_monitor_components()
-
-        storage = storage_monitor.get_storage_overview()
+        storage = _cached("storage", _STORAGE_MONITOR.get_storage_overview)
 
         # Calculate total usage
-        total_gb = sum(s["usage"]["total_gb"] for s in storage)
-        used_gb = sum(s["usage"]["used_gb"] for s in storage)
-
-        return jsonify(
-            ok(
-                {
-                    "state": round(used_gb / total_gb * 100, 2) if total_gb > 0 else 0,
-                    "attributes": {
-                        "unit_of_measurement": "%",
-                        "friendly_name": "fnOS Overseer Storage Usage",
-                        "total_gb": total_gb,
-                        "used_gb": used_gb,
-                        "free_gb": total_gb - used_gb,
-                        "devices": storage,
-                    },
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
-                }
-            )
-        )
+        total_gb, used_gb = _storage_totals(storage)
+
+        sensor = {
+            "state": round(used_gb / total_gb * 100, 2) if total_gb > 0 else 0,
+            "attributes": {
+                "unit_of_measurement": "%",
+                "friendly_name": "fnOS Overseer Storage Usage",
+                "total_gb": total_gb,
+                "used_gb": used_gb,
+                "free_gb": total_gb - used_gb,
+                "devices": storage,
+            },
+        }
+        # Storage rarely changes between polls; tag on the reading, not the timestamp
+        return _conditional(jsonify(ok({**sensor, "last_updated": ts})), sensor)
 
     except Exception as e:
         logger.error(f"Error in /ha/storage: {e}", exc_info=True)
@@ -274,21 +359,22 @@ def ha_storage():
                 {
                     "state": 0,
                     "attributes": {"unit_of_measurement": "%", "error": str(e)},
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
+                    "last_updated": ts,
                 }
             )
         )
 
 
 @bp.get("/ha/sensors")
-def ha_sensors():
+async def ha_sensors():
     """
     Get all sensors in a single call (batch endpoint).
 
     This is useful for Home Assistant to fetch multiple sensors at once.
 
+    Pass ?format=msgpack for a MessagePack body instead of JSON (falls back
+    to JSON when msgpack is not installed).
+
     Returns:
         {
           "power": {...},
@@ -296,64 +382,77 @@ def ha_sensors():
           "storage": {...}
         }
     """
+    ts = _now_iso()
     try:
         # Get individual sensors
         # (This would normally call the individual endpoints, but for efficiency
         # we can inline the logic here)
 
-        cpu_monitor, storage_monitor, power_calc = _get_monitor_components()
-
-        # CPU
-        cpu_info = cpu_monitor.get_cpu_info()
-        cpu_usage = cpu_monitor.get_cpu_usage(interval=0.2)
-        cpu_power = cpu_monitor.estimate_cpu_power(cpu_usage)
+        # The external power fetch, the CPU sample and the storage scan all
+        # wait on I/O or sleep; run them side by side off the event loop
+        external_power, cpu_usage, storage = await asyncio.gather(
+            _external_power(),
+            _run_blocking(
+                _cached, "cpu_usage", lambda: _CPU_MONITOR.get_cpu_usage(interval=0.2)
+            ),
+            _run_blocking(_cached, "storage", _STORAGE_MONITOR.get_storage_overview),
+        )
 
         # Storage
-        storage = storage_monitor.get_storage_overview()
-        total_gb = sum(s["usage"]["total_gb"] for s in storage)
-        used_gb = sum(s["usage"]["used_gb"] for s in storage)
+        total_gb, used_gb = _storage_totals(storage)
 
-        # Power
-        power_result = power_calc.estimate_total_power()
-        external_power = _get_external_power()
+        # CPU
+        cpu_info = _CPU_MONITOR.get_cpu_info()
+        cpu_power = _CPU_MONITOR.estimate_cpu_power(cpu_usage)
+
+        # Power: the internal estimate is only needed without an external reading
         if external_power is not None:
             total_watts = external_power
-            power_source = "external_monitoring"
+            power_breakdown = {}
         else:
+            power_result = await _run_blocking(
+                _cached, "power", _POWER_CALC.estimate_total_power
+            )
             total_watts = power_result["total_watts"]
-            power_source = "internal_estimation"
+            power_breakdown = power_result["breakdown"]
 
-        return jsonify(
-            ok(
-                {
-                    "power": {
-                        "state": total_watts,
-                        "attributes": power_result["breakdown"],
-                    },
-                    "cpu": {
-                        "state": cpu_usage,
-                        "attributes": {
-                            "model": cpu_info.get("model", "Unknown"),
-                            "physical_cores": cpu_info.get("physical_cores", 0),
-                            "logical_cores": cpu_info.get("logical_cores", 0),
-                            "frequency_mhz": cpu_info.get("frequency_current", 0),
-                            "power_watts": cpu_power,
-                        },
+        payload = ok(
+            {
+                "power": {
+                    "state": total_watts,
+                    "attributes": power_breakdown,
+                },
+                "cpu": {
+                    "state": cpu_usage,
+                    "attributes": {
+                        "model": cpu_info.get("model", "Unknown"),
+                        "physical_cores": cpu_info.get("physical_cores", 0),
+                        "logical_cores": cpu_info.get("logical_cores", 0),
+                        "frequency_mhz": cpu_info.get("frequency_current", 0),
+                        "power_watts": cpu_power,
                     },
-                    "storage": {
-                        "state": (
-                            round(used_gb / total_gb * 100, 2) if total_gb > 0 else 0
-                        ),
-                        "attributes": {
-                            "total_gb": total_gb,
-                            "used_gb": used_gb,
-                            "free_gb": total_gb - used_gb,
-                            "devices": storage,
-                        },
+                },
+                "storage": {
+                    "state": (
+                        round(used_gb / total_gb * 100, 2) if total_gb > 0 else 0
+                    ),
+                    "attributes": {
+                        "total_gb": total_gb,
+                        "used_gb": used_gb,
+                        "free_gb": total_gb - used_gb,
+                        "devices": storage,
                     },
-                }
-            )
+                },
+            }
         )
+        if request.args.get("format") == "msgpack":
+            msgpack = _msgpack()
+            if msgpack is not None:
+                return Response(
+                    msgpack.packb(payload, use_bin_type=True),
+                    mimetype="application/msgpack",
+                )
+        return jsonify(payload)
 
     except Exception as e:
         logger.error(f"Error in /ha/sensors: {e}", exc_info=True)
@@ -361,14 +460,43 @@ def ha_sensors():
             ok(
                 {
                     "error": str(e),
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
+                    "last_updated": ts,
                 }
             )
         )
 
 
+# Everything in the status payload except the timestamp is fixed at startup
+_HA_STATUS_ATTRIBUTES: Dict[str, Any] = {}
+
+
+def _refresh_env() -> None:
+    """
+    Re-read the HA settings taken from the environment.
+
+    Called once at import; call again after os.environ changes (e.g. a
+    config update) so the module constants pick up the new values.
+    """
+    global _HA_ENTITY_POWER, _HA_API_URL, _HA_HEADERS, _HA_STATUS_ATTRIBUTES
+    _HA_ENTITY_POWER = os.getenv("HA_ENTITY_POWER", "")
+    _HA_API_URL = os.getenv("HA_API_URL", "http://supervisor/core/api")
+    _HA_HEADERS = {
+        "Authorization": f"Bearer {os.getenv('HA_API_TOKEN', '')}",
+        "Content-Type": "application/json",
+    }
+    _HA_STATUS_ATTRIBUTES = {
+        "friendly_name": "fnOS Overseer Status",
+        "version": os.getenv("APP_VERSION", "1.0.0"),
+        "environment": os.getenv("APP_ENV", "unknown"),
+        "auth_required": auth_config.requires_auth,
+        "is_production": auth_config.is_production,
+        "power_source": os.getenv("HA_POWER_SOURCE", "internal"),
+    }
+
+
+_refresh_env()
+
+
 @bp.get("/ha/status")
 def ha_status():
     """
@@ -376,23 +504,15 @@ def ha_status():
 
     Useful for Home Assistant to check if fnOS_Overseer is running properly.
     """
-    from core.config.config_manager import auth_config
-
-    return jsonify(
+    response = jsonify(
         ok(
             {
                 "status": "ok",
                 "attributes": {
-                    "friendly_name": "fnOS Overseer Status",
-                    "version": os.getenv("APP_VERSION", "1.0.0"),
-                    "environment": os.getenv("APP_ENV", "unknown"),
-                    "auth_required": auth_config.requires_auth,
-                    "is_production": auth_config.is_production,
-                    "power_source": os.getenv("HA_POWER_SOURCE", "internal"),
-                    "last_updated": importlib.import_module("datetime")
-                    .datetime.now()
-                    .isoformat(),
+                    **_HA_STATUS_ATTRIBUTES,
+                    "last_updated": _now_iso(),
                 },
             }
         )
     )
+    return _conditional(response, _HA_STATUS_ATTRIBUTES)
@@ -1,11 +1,9 @@
 from flask import jsonify
 from web.backend.api.v1 import bp, require_super_admin
-from core.monitor import CPUMonitor, StorageMonitor, PowerCalculator
+from core.monitor import get_monitors
 from web.backend.models.data_models import ok
 
-cpu = CPUMonitor()
-storage = StorageMonitor()
-power = PowerCalculator(cpu, storage)
+cpu, storage, power = get_monitors()
 
 
 @bp.get("/monitor/cpu")
@@ -1,4 +1,3 @@
-import importlib
 from flask import jsonify
 from web.backend.api.v1 import bp, require_super_admin
 from core.report.daily_report import DailyReportBuilder
@@ -1,6 +1,17 @@
+import hashlib
 import logging
+import queue
+import threading
+from collections import OrderedDict
 
 from flask import request, jsonify
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 from web.backend.api.v1 import bp
 from web.backend.models.data_models import ok, err
 from core.behavior import process_user_behavior
@@ -8,6 +19,53 @@ from core.auth import require_api_token
 
 logger = logging.getLogger(__name__)
 
+# Digests of recently processed bodies, so fnOS retries are not processed twice
+_RECENT: "OrderedDict[bytes, None]" = OrderedDict()
+_RECENT_LOCK = threading.Lock()
+_RECENT_MAX = 1024
+
+
+def _seen_before(body: bytes) -> bool:
+    """Record body's digest; True if it was already among the recent payloads."""
+    digest = hashlib.blake2b(body, digest_size=16).digest()
+    with _RECENT_LOCK:
+        if digest in _RECENT:
+            _RECENT.move_to_end(digest)
+            return True
+        _RECENT[digest] = None
+        if len(_RECENT) > _RECENT_MAX:
+            _RECENT.popitem(last=False)
+        return False
+
+
+# Payloads are processed off the request thread so fnOS gets its ACK right away
+_WEBHOOK_Q: "queue.SimpleQueue[dict]" = queue.SimpleQueue()
+_WEBHOOK_Q_MAX = 10000
+_MAX_PAYLOAD = 256 * 1024
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def _drain() -> None:
+    while True:
+        data = _WEBHOOK_Q.get()
+        try:
+            process_user_behavior(data)
+        except Exception as e:
+            logger.error(f"Error processing webhook: {e}", exc_info=True)
+
+
+def _ensure_worker() -> None:
+    # Started on first use rather than at import, so it lives in the serving
+    # process even when the app is loaded before a fork
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_drain, name="webhook-worker", daemon=True)
+            _worker.start()
+
 
 @bp.post("/webhook/fnos/user_behavior")
 @require_api_token
@@ -21,24 +79,42 @@ def fnos_webhook():
     2. Authorization header (Bearer token)
     3. token query parameter
     """
+    if request.content_length is not None and request.content_length > _MAX_PAYLOAD:
+        logger.warning(f"Rejected webhook payload of {request.content_length} bytes")
+        return jsonify(err(413, "Payload too large")), 413
+
     try:
-        # Attempt to parse JSON payload
-        data = request.get_json(force=True, silent=True)
+        # Read the body once; it is parsed and hashed from the same buffer
+        body = request.get_data(cache=False)
+        try:
+            data = _loads(body) if body else None
+        except ValueError:
+            data = None
 
         if not data:
-            # Fallback for form data or other content types if needed,
-            # but webhooks are usually JSON.
-            # If data is None, it means parsing failed or body is empty.
+            # Webhooks are expected to be JSON; parsing failed or body is empty
             logger.warning("Received webhook with no JSON data")
             return jsonify(err(400, "Invalid JSON payload or empty body")), 400
 
-        logger.info(f"Received webhook payload: {data}")
+        # Checked before the payload is recorded as seen, so the sender's
+        # retry of a dropped payload is not mistaken for a duplicate
+        if _WEBHOOK_Q.qsize() > _WEBHOOK_Q_MAX:
+            logger.warning("Webhook queue full, dropping payload")
+            return jsonify(err(503, "Webhook queue full, retry later")), 503
+
+        if _seen_before(body):
+            logger.info("Duplicate webhook payload ignored")
+            return jsonify(ok({"message": "Duplicate webhook ignored"})), 200
+
+        # Payloads can be large; only format them when debug logging is on
+        logger.debug("Received webhook payload: %r", data)
 
-        # Process the data through the core behavior analyzer
-        # This function logs the raw data and provides a hook for user customization
-        process_user_behavior(data)
+        # Processed by the core behavior analyzer on the worker thread
+        # That function logs the raw data and provides a hook for user customization
+        _ensure_worker()
+        _WEBHOOK_Q.put(data)
 
-        return jsonify(ok({"message": "Webhook received and processed"})), 200
+        return jsonify(ok({"message": "Webhook received"})), 200
 
     except Exception as e:
         logger.error(f"Error processing webhook: {e}", exc_info=True)
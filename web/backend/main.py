@@ -1,13 +1,15 @@
+import hashlib
 import os
-import importlib
 from pathlib import Path
 
-from flask import Flask
-from web.backend.api.v1 import bp as api_v1_bp
+from flask import Flask, Response, request
+from web.backend.api.v1 import register_routes
 from core.schedule.scheduler import start as start_scheduler
+from adapter.fnos.warmup import start_warmup
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PORT = int(os.getenv("PORT", "8000"))
 
 def create_app():
     app = Flask(
@@ -15,15 +17,33 @@ def create_app():
         static_folder=str(PROJECT_ROOT / "web" / "static"),
         static_url_path="/static"
     )
-    app.register_blueprint(api_v1_bp)
+    try:
+        from web.backend.json_provider import OrjsonProvider
+        app.json = OrjsonProvider(app)
+    except ImportError:
+        # orjson is optional; keep Flask's default provider without it
+        pass
+    app.register_blueprint(register_routes())
+    # Let browsers cache the other static assets too
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
+
+    # index.html ships with the app; read it and compute its ETag once
+    index_bytes = (PROJECT_ROOT / "web" / "static" / "index.html").read_bytes()
+    index_etag = hashlib.blake2b(index_bytes, digest_size=8).hexdigest()
 
     # Add route to serve index.html at root
     @app.route("/")
     def index():
-        return app.send_static_file("index.html")
+        response = Response(index_bytes, mimetype="text/html")
+        response.set_etag(index_etag)
+        response.headers["Cache-Control"] = "public, max-age=3600"
+        return response.make_conditional(request)
 
     return app
 
+# The HA sensor endpoints are async views (needs Flask[async]). Flask is a
+# WSGI framework, so each one still occupies a worker while it runs; the
+# async form lets its blocking lookups overlap instead of running back to back.
 app = create_app()
 
 if __name__ == "__main__":
@@ -31,5 +51,5 @@ if __name__ == "__main__":
         start_scheduler()
     except Exception:
         pass
-    port = int(os.getenv("PORT", "8000"))
-    app.run(host="0.0.0.0", port=port)
+    start_warmup()
+    app.run(host="0.0.0.0", port=PORT)
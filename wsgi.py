@@ -0,0 +1,13 @@
+"""
+WSGI entrypoint for gunicorn (see gunicorn.conf.py).
+
+Every worker warms its own caches. The daily report scheduler runs in
+whichever worker holds data/scheduler.lock, so the report is sent once
+rather than once per worker.
+"""
+from web.backend.main import app, PROJECT_ROOT
+from core.schedule.scheduler import start_exclusive
+from adapter.fnos.warmup import start_warmup
+
+start_exclusive(PROJECT_ROOT / "data" / "scheduler.lock")
+start_warmup()